@@ -0,0 +1,61 @@
+"""Persistent map from image content hash to the Discord CDN URL it was last uploaded to.
+
+Once an image has been sent as an attachment, later responses point the embed at the
+CDN URL instead of uploading the same bytes again. Discord signs attachment URLs with an
+expiry (the hex `ex` query parameter); an expired URL counts as a miss and the image is
+uploaded again, which stores a fresh URL.
+
+The table is mirrored in memory, so lookups never touch SQLite; new URLs are remembered
+at once and written to disk by save(), which callers run off the event loop.
+"""
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+ATTACHMENT_CACHE_PATH = 'attachments.sqlite'
+# Upload again slightly before Discord's expiry so a URL never expires while a message is on screen.
+EXPIRY_MARGIN = 3600
+
+
+def url_expiry(url):
+    """Unix time a signed Discord CDN URL expires at, or None when it carries no expiry."""
+    expiry = parse_qs(urlsplit(url).query).get("ex")
+    try:
+        return int(expiry[0], 16) if expiry else None
+    except ValueError:
+        return None
+
+
+class AttachmentCache:
+    def __init__(self, path=ATTACHMENT_CACHE_PATH):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS attachments (digest TEXT PRIMARY KEY, url TEXT NOT NULL, expires INTEGER)"
+            )
+        rows = self.connection.execute("SELECT digest, url, expires FROM attachments")
+        self.urls = {digest: (url, expires) for digest, url, expires in rows}
+        # Saves run in worker threads and share the one connection.
+        self.lock = threading.Lock()
+
+    def get(self, digest):
+        """The CDN URL for digest, or None when it was never uploaded or the URL is about to expire."""
+        entry = self.urls.get(digest)
+        if entry is None:
+            return None
+        url, expires = entry
+        if expires is not None and expires - EXPIRY_MARGIN <= time.time():
+            return None
+        return url
+
+    def put(self, digest, url):
+        """Remember url for digest in memory; save() persists it."""
+        self.urls[digest] = (url, url_expiry(url))
+
+    def save(self, digest, url):
+        """Write url for digest to the SQLite file. Blocking, so run it in a worker thread."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO attachments VALUES (?, ?, ?)", (digest, url, url_expiry(url))
+            )
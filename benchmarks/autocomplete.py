@@ -0,0 +1,63 @@
+"""Per-keystroke autocomplete latency for every category, checked against a p99 budget.
+
+Simulates a user typing each sampled name one character at a time and times
+NameIndex.complete plus building the app_commands.Choice list Discord receives.
+Exits non-zero when any category's p99 exceeds the budget.
+
+Run from the repository root:
+
+    python -m benchmarks.autocomplete [--budget-ms 1.0]
+"""
+import argparse
+import sys
+import time
+
+from discord import app_commands
+
+from data import csv_files
+from records import load_tables
+from search_index import NameIndex
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tables = load_tables()
+    indexes = {category: NameIndex(tables[category]) for category in csv_files}
+    indexes["remembrances (boss)"] = NameIndex(tables["remembrances"], column="boss")
+    indexes["greatRunes (boss)"] = NameIndex(tables["greatRunes"], column="boss")
+
+    over_budget = []
+    print(f"{'category':<22}{'keystrokes':>11}{'p50 us':>9}{'p99 us':>9}{'max us':>9}")
+    for category, index in indexes.items():
+        names = [name for name in index.names if isinstance(name, str)]
+        keystrokes = [name[:length] for name in names[::max(1, len(names) // 40)] for length in range(len(name) + 1)]
+
+        timings = []
+        for _ in range(args.repeat):
+            for current in keystrokes:
+                start = time.perf_counter()
+                [app_commands.Choice(name=name[:100], value=name[:100]) for name in index.complete(current)]
+                timings.append((time.perf_counter() - start) * 1e6)
+
+        p99 = percentile(timings, 0.99)
+        if p99 > args.budget_ms * 1e3:
+            over_budget.append(category)
+        print(f"{category:<22}{len(keystrokes):>11}{percentile(timings, 0.5):>9.1f}{p99:>9.1f}{max(timings):>9.1f}")
+
+    if over_budget:
+        print(f"p99 over {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+    print(f"All categories within the {args.budget_ms} ms p99 budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Cost of a /compare card: drawn cold vs. served from the image cache vs. linked from the CDN cache.
+
+Pairs are drawn at random from each comparable category. Drawing happens in a worker thread
+the way the bot does it, so the event loop only waits on it; a ticker task measures how late
+the loop wakes it.
+
+Run from the repository root:
+
+    python -m benchmarks.compare_cards [--pairs N]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import compare_cards
+from compare_cards import card_key, card_path, render_card
+from image_cache import ImageCache
+from schemas import categories
+from snapshot import load_state
+
+
+async def ticker(lags, interval=0.001):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=10, help="pairs per category")
+    args = parser.parse_args()
+
+    state = load_state()
+    manifest = state["image_manifest"]
+    random.seed(0)
+    cards = []
+    for category in categories:
+        if category.compare:
+            for _ in range(args.pairs):
+                rows = random.sample(list(state["tables"][category.key]), 2)
+                columns = [
+                    (row['name'], getattr(manifest.get(category.key, row['image']), 'path', None),
+                     category.compare_fields(row))
+                    for row in rows
+                ]
+                cards.append((card_key(category, rows, state["version"]), columns))
+
+    compare_cards.CARDS_PATH = tempfile.mkdtemp()
+    cache = ImageCache()
+    cdn_urls = {}
+    lags = []
+    task = asyncio.create_task(ticker(lags))
+    await asyncio.sleep(0)
+
+    async def drawn(key, columns):
+        await asyncio.to_thread(render_card, columns, card_path(key))
+        return await cache.get(card_path(key))
+
+    async def from_disk(key, columns):
+        return await cache.get(card_path(key))
+
+    async def from_cdn(key, columns):
+        return cdn_urls[key]
+
+    print(f"{'source':<10}{'cards':>7}{'mean ms':>10}{'max ms':>9}{'max loop lag ms':>17}")
+    for name, serve in (("drawn", drawn), ("cached", from_disk), ("CDN URL", from_cdn)):
+        lags.clear()
+        timings = []
+        for key, columns in cards:
+            start = time.perf_counter()
+            await serve(key, columns)
+            timings.append(time.perf_counter() - start)
+            cdn_urls[key] = f"https://cdn.discordapp.com/attachments/{key}.png"
+        print(f"{name:<10}{len(timings):>7}{sum(timings) / len(timings) * 1e3:>10.3f}"
+              f"{max(timings) * 1e3:>9.3f}{max(lags, default=0.0) * 1e3:>17.2f}")
+    task.cancel()
+    sizes = [os.path.getsize(card_path(key)) for key, _ in cards]
+    print(f"mean card size {sum(sizes) / len(sizes) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
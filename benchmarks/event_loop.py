@@ -0,0 +1,85 @@
+"""Event-loop lag while a burst of searches and card renders is served inline vs. in worker pools.
+
+Each request runs the "search" stage (a fuzzy lookup in the global index) and every fifth
+one also draws a comparison card. The LoopMonitor samples how late the loop wakes it, which
+is how late heartbeats and other interactions would run.
+
+Run from the repository root:
+
+    python -m benchmarks.event_loop [--requests N] [--processes N]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from compare_cards import render_card
+from schemas import categories
+from snapshot import load_state
+from workers import LoopMonitor, Workers
+
+
+async def serve(requests, run):
+    monitor = LoopMonitor(interval=0.002, window=100000)
+    monitor.start()
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(run(*request) for request in requests))
+    elapsed = time.perf_counter() - start
+    # Inline requests never yield, so the monitor's late wakeup only comes after gather returns; let it record it.
+    samples = len(monitor.lags)
+    while len(monitor.lags) == samples:
+        await asyncio.sleep(monitor.interval)
+    monitor.stop()
+    lags = sorted(monitor.lags)
+    return elapsed, lags[int(len(lags) * 0.99)], monitor.max_lag
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    state = load_state()
+    global_index = state["global_index"]
+    weapons = next(category for category in categories if category.key == "weapons")
+    rows = list(state["tables"]["weapons"])
+    random.seed(0)
+    directory = tempfile.mkdtemp()
+    requests = []
+    for number in range(args.requests):
+        query = random.choice(global_index.names)[:6] + "x"
+        card = None
+        if number % 5 == 0:
+            columns = [(row['name'], None, weapons.compare_fields(row)) for row in random.sample(rows, 2)]
+            card = (columns, os.path.join(directory, f"{number}.png"))
+        requests.append((query, card))
+
+    async def inline(query, card):
+        global_index.search(query)
+        if card is not None:
+            render_card(*card)
+
+    def pooled(workers):
+        async def run(query, card):
+            await workers.run(global_index.search, query)
+            if card is not None:
+                await workers.run(render_card, *card, heavy=True)
+
+        return run
+
+    threads = Workers()
+    processes = Workers(processes=args.processes)
+    print(f"{'mode':<16}{'total s':>9}{'p99 lag ms':>12}{'max lag ms':>12}")
+    for name, run in (("inline", inline), ("thread pool", pooled(threads)), ("process pool", pooled(processes))):
+        elapsed, p99, max_lag = await serve(requests, run)
+        print(f"{name:<16}{elapsed:>9.2f}{p99 * 1e3:>12.1f}{max_lag * 1e3:>12.1f}")
+    threads.shutdown()
+    processes.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Latency of full-text queries: pandas column scans vs. the SQLite FTS5 backend.
+
+The pandas path is what the same query costs against the dataframes dict: a
+case-insensitive str.contains over name, description, effect and passive effect
+of every category.
+
+Run from the repository root:
+
+    python -m benchmarks.full_text [--repeat N]
+"""
+import argparse
+import re
+import time
+
+from data import load_dataframes
+from fts_search import TEXT_COLUMNS, FullTextIndex
+from snapshot import load_state, source_hash
+
+queries = ["raises maximum hp", "moonveil", "blood loss", "golden vow", "frenzy", "boosts holy damage negation"]
+
+
+def pandas_search(dataframes, search_value):
+    pattern = re.escape(search_value)
+    hits = []
+    for category, df in dataframes.items():
+        mask = None
+        for column in TEXT_COLUMNS.values():
+            if column in df:
+                matches = df[column].str.contains(pattern, case=False, na=False)
+                mask = matches if mask is None else mask | matches
+        hits += [(category, name) for name in df.loc[mask, 'name']]
+    return hits
+
+
+def time_query(fn, query, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = fn(query)
+    return (time.perf_counter() - start) / repeat * 1e6, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    dataframes = load_dataframes()
+    full_text_index = FullTextIndex(load_state()["tables"], source_hash())
+
+    print(f"{'query':<32}{'pandas us':>11}{'hits':>6}{'fts5 us':>10}{'hits':>6}  top fts5 hit")
+    for query in queries:
+        pandas_us, pandas_hits = time_query(lambda value: pandas_search(dataframes, value), query, args.repeat)
+        fts_us, fts_hits = time_query(full_text_index.search, query, args.repeat)
+        top = full_text_index.search(query, limit=1)
+        print(f"{query:<32}{pandas_us:>11.1f}{pandas_hits:>6}{fts_us:>10.1f}{fts_hits:>6}  "
+              f"{f'{top[0].name} ({top[0].category})' if top else '-'}")
+
+
+if __name__ == "__main__":
+    main()
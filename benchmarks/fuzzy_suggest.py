@@ -0,0 +1,58 @@
+"""Latency of "did you mean" suggestions for misspelled queries in every category.
+
+Run from the repository root:
+
+    python -m benchmarks.fuzzy_suggest [--repeat N]
+"""
+import argparse
+import random
+import time
+
+from data import csv_files
+from records import load_tables
+from search_index import NameIndex
+
+
+def misspell(name, rng):
+    letters = list(name)
+    position = rng.randrange(1, len(letters) - 1)
+    if rng.random() < 0.5:
+        letters[position], letters[position + 1] = letters[position + 1], letters[position]
+    else:
+        del letters[position]
+    return "".join(letters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tables = load_tables()
+
+    print(f"{'category':<18}{'build ms':>10}{'queries':>9}{'hit rate':>10}{'mean us':>10}{'max us':>10}")
+    for category in csv_files:
+        start = time.perf_counter()
+        index = NameIndex(tables[category])
+        build = (time.perf_counter() - start) * 1e3
+
+        names = [name for name in index.names if isinstance(name, str) and len(name) > 5]
+        typos = [(name, misspell(name, rng)) for name in rng.sample(names, min(25, len(names)))]
+
+        hits = 0
+        timings = []
+        for name, typo in typos:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                suggestions = index.suggest(typo)
+                timings.append((time.perf_counter() - start) * 1e6)
+            hits += name in suggestions
+
+        print(f"{category:<18}{build:>10.1f}{len(typos):>9}{hits / len(typos):>10.0%}"
+              f"{sum(timings) / len(timings):>10.1f}{max(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
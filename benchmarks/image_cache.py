@@ -0,0 +1,64 @@
+"""Event-loop stalls while serving images: synchronous reads vs. the byte-budgeted ImageCache.
+
+Requests follow a skewed popularity curve over every image under images/, so a few images
+are hot and most are cold. A ticker task measures how late the event loop wakes it.
+
+Run from the repository root:
+
+    python -m benchmarks.image_cache [--requests N] [--budget-mb MB]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from image_cache import ImageCache, read_image
+from image_variants import source_images
+
+
+async def ticker(lags, interval=0.001):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def serve(requests, get):
+    lags = []
+    task = asyncio.create_task(ticker(lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for path in requests:
+        await get(path)
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    task.cancel()
+    return elapsed, max(lags, default=0.0)
+
+
+async def read_synchronously(path):
+    return read_image(path)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--budget-mb", type=int, default=64)
+    args = parser.parse_args()
+
+    paths = list(source_images())
+    random.seed(0)
+    random.shuffle(paths)
+    weights = [1 / rank for rank in range(1, len(paths) + 1)]
+    requests = random.choices(paths, weights, k=args.requests)
+
+    cache = ImageCache(args.budget_mb * 2 ** 20)
+    print(f"{'reader':<14}{'per request us':>16}{'max loop lag ms':>17}")
+    for name, get in (("synchronous", read_synchronously), ("ImageCache", cache.get)):
+        elapsed, lag = await serve(requests, get)
+        print(f"{name:<14}{elapsed / len(requests) * 1e6:>16.1f}{lag * 1e3:>17.2f}")
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Per-query latency of the old DataFrame scan vs. the normalized NameIndex.
+
+Run from the repository root:
+
+    python -m benchmarks.name_index [--repeat N]
+"""
+import argparse
+import re
+import time
+
+import pandas as pd
+
+from data import csv_files, load_dataframes
+from records import load_tables
+from search_index import NameIndex
+
+
+def legacy_search(df_name, search_value):
+    try:
+        exact_match = df_name[df_name['name'].str.lower() == search_value.lower()]
+        if not exact_match.empty:
+            return exact_match
+
+        return df_name[df_name['name'].str.contains(search_value, case=False, na=False)]
+    except re.error:
+        return pd.DataFrame()
+
+
+def sample_queries(df):
+    names = df['name'].dropna().tolist()
+    exact = names[::max(1, len(names) // 20)]
+    partial = [name[1:5] for name in exact if len(name) > 5]
+    return exact + partial
+
+
+def time_per_query(fn, queries, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    dataframes = load_dataframes()
+    tables = load_tables()
+
+    print(f"{'category':<18}{'rows':>6}{'queries':>9}{'legacy us':>12}{'index us':>11}{'lookup us':>11}{'speedup':>9}")
+    for category in csv_files:
+        df = dataframes[category]
+        index = NameIndex(tables[category])
+        queries = sample_queries(df)
+
+        legacy = time_per_query(lambda query: legacy_search(df, query), queries, args.repeat)
+        indexed = time_per_query(index.search, queries, args.repeat)
+        lookup = time_per_query(index.lookup, queries, args.repeat)
+
+        print(f"{category:<18}{len(df):>6}{len(queries):>9}{legacy:>12.1f}{indexed:>11.1f}{lookup:>11.2f}{legacy / indexed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Import time, RSS and per-lookup latency: pandas dataframes dict vs. the records store.
+
+Each store is measured in a fresh interpreter so import time and memory are not shared.
+
+Run from the repository root:
+
+    python -m benchmarks.record_store [--runs N]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+DETAIL_COLUMNS = ['name', 'image', 'description', 'dlc']
+
+
+def measure_pandas():
+    start = time.perf_counter()
+    import pandas  # noqa: F401
+    from data import load_dataframes
+    imported = time.perf_counter()
+    dataframes = load_dataframes()
+    loaded = time.perf_counter()
+
+    def lookup(category, search_value):
+        df = dataframes[category]
+        results = df[df['name'].str.lower() == search_value.lower()]
+        for _, row in results.iterrows():
+            [row[column] for column in DETAIL_COLUMNS if column in row]
+        return len(results)
+
+    names = [(category, name) for category, df in dataframes.items() for name in df['name'].tolist()[::10]]
+    return imported - start, loaded - imported, time_lookups(lookup, names)
+
+
+def measure_records():
+    start = time.perf_counter()
+    from records import load_tables
+    from search_index import NameIndex
+    imported = time.perf_counter()
+    tables = load_tables()
+    loaded = time.perf_counter()
+    indexes = {category: NameIndex(table) for category, table in tables.items()}
+
+    def lookup(category, search_value):
+        results = indexes[category].search(search_value)
+        for row in results:
+            [row.get(column) for column in DETAIL_COLUMNS]
+        return len(results)
+
+    names = [(category, name) for category, table in tables.items() for name in table.column('name')[::10]]
+    return imported - start, loaded - imported, time_lookups(lookup, names)
+
+
+def time_lookups(lookup, names, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for category, name in names:
+            lookup(category, name)
+    return (time.perf_counter() - start) / (repeat * len(names))
+
+
+def child(store):
+    import_seconds, load_seconds, lookup_seconds = {"pandas": measure_pandas, "records": measure_records}[store]()
+    print(json.dumps({
+        "import_ms": import_seconds * 1e3,
+        "load_ms": load_seconds * 1e3,
+        "lookup_us": lookup_seconds * 1e6,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", choices=["pandas", "records"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    print(f"{'store':<10}{'import ms':>11}{'load ms':>10}{'lookup us':>11}{'peak RSS MB':>13}")
+    for store in ("pandas", "records"):
+        runs = [
+            json.loads(subprocess.check_output([sys.executable, "-m", "benchmarks.record_store", "--child", store]))
+            for _ in range(args.runs)
+        ]
+        best = {key: min(run[key] for run in runs) for key in runs[0]}
+        print(f"{store:<10}{best['import_ms']:>11.1f}{best['load_ms']:>10.1f}{best['lookup_us']:>11.1f}{best['rss_mb']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
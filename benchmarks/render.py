@@ -0,0 +1,43 @@
+"""Per-row cost of compiling the render plan for every row of every category.
+
+Run from the repository root:
+
+    python -m benchmarks.render [--repeat N]
+"""
+import argparse
+import time
+
+from records import load_tables
+from schemas import categories
+
+
+def time_per_row(fn, rows, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row in rows:
+            fn(row)
+    return (time.perf_counter() - start) / (repeat * len(rows)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tables = load_tables()
+
+    print(f"{'category':<18}{'rows':>6}{'summary us':>12}{'detail us':>11}{'image us':>10}")
+    for category in categories:
+        table = tables[category.key]
+        category.compile(table.columns)
+        rows = list(table)
+
+        summary = time_per_row(category.summary_field, rows, args.repeat)
+        detail = time_per_row(category.detail_fields, rows, args.repeat)
+        image = time_per_row(category.image, rows, args.repeat)
+
+        print(f"{category.key:<18}{len(rows):>6}{summary:>12.2f}{detail:>11.2f}{image:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
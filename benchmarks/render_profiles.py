@@ -0,0 +1,72 @@
+"""Bytes sent and modeled end-to-end latency of single-result responses under each render profile.
+
+Every row with an image is rendered the way the bot does it: detail fields, the variant
+the profile picks, and its bytes read through the ImageCache. Bytes are measured for a
+first send, before the attachment URL cache can link an earlier upload. End-to-end latency
+adds the upload time of the payload at --uplink-mbps and one --rtt-ms round trip to the
+measured local build time.
+
+Run from the repository root:
+
+    python -m benchmarks.render_profiles [--uplink-mbps N] [--rtt-ms N] [--quality full|still|thumbnail]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from guild_settings import RENDER_PROFILES
+from image_cache import ImageCache
+from image_variants import ImageVariants
+from schemas import categories
+from snapshot import load_state
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def render(category, row, entry, profile, quality, variants, cache):
+    start = time.perf_counter()
+    payload = len(json.dumps(category.detail_fields(row)).encode())
+    if profile != "text":
+        image = await cache.get(variants.pick(entry.path, "thumbnail" if profile == "thumbnail" else quality))
+        payload += len(image.data)
+    return payload, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uplink-mbps", type=float, default=10.0)
+    parser.add_argument("--rtt-ms", type=float, default=100.0)
+    parser.add_argument("--quality", default="full", help="IMAGE_PROFILE used by the full render profile")
+    args = parser.parse_args()
+
+    state = load_state()
+    manifest = state["image_manifest"]
+    variants = ImageVariants.load()
+    cache = ImageCache()
+    rows = [
+        (category, row, entry)
+        for category in categories
+        for row in state["tables"][category.key]
+        if (entry := manifest.get(category.key, row['image'])) is not None
+    ]
+
+    print(f"{'profile':<11}{'rows':<8}{'mean KB':>9}{'p95 KB':>9}{'MB/1000':>9}{'build ms':>10}{'e2e ms':>9}{'p95 e2e':>9}")
+    for profile in RENDER_PROFILES:
+        for label, selected in (("all", rows), ("skills", [r for r in rows if r[0].key == "skills"])):
+            measured = [await render(*r, profile, args.quality, variants, cache) for r in selected]
+            sizes = [size for size, _ in measured]
+            latencies = [
+                (seconds + size * 8 / (args.uplink_mbps * 1e6)) * 1e3 + args.rtt_ms for size, seconds in measured
+            ]
+            print(f"{profile:<11}{label:<8}{sum(sizes) / len(sizes) / 1024:>9.1f}{percentile(sizes, 0.95) / 1024:>9.1f}"
+                  f"{sum(sizes) / len(sizes) * 1000 / 2 ** 20:>9.1f}"
+                  f"{sum(seconds for _, seconds in measured) / len(measured) * 1e3:>10.3f}"
+                  f"{sum(latencies) / len(latencies):>9.1f}{percentile(latencies, 0.95):>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Per-lookup cost of a detail embed: built per request vs. patched from the response bundle.
+
+"built" formats the category's detail fields into a discord.Embed and serializes it, as
+handlers did before the bundle; "bundle" looks the row up and merges in the branding.
+
+Run from the repository root:
+
+    python -m benchmarks.response_bundle [--repeat N]
+"""
+import argparse
+import time
+from datetime import datetime
+
+import discord
+
+from schemas import categories
+from snapshot import load_state
+
+
+def time_per_row(fn, rows, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for category, row in rows:
+            fn(category, row)
+    return (time.perf_counter() - start) / (repeat * len(rows)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    state = load_state()
+    bundle = state["response_bundle"]
+    rows = [(category, row) for category in categories for row in state["tables"][category.key]]
+    branding = discord.Embed(timestamp=datetime.now())
+    branding.set_author(name="Lands Between", icon_url="https://example.com/icon.png")
+    branding.set_footer(text="S2RT", icon_url="https://example.com/icon.png")
+    branding = branding.to_dict()
+
+    def built(category, row):
+        embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
+        embed.set_author(name="Lands Between", icon_url="https://example.com/icon.png")
+        for name, value, inline in category.detail_fields(row):
+            embed.add_field(name=name, value=value, inline=inline)
+        embed.set_footer(text="S2RT", icon_url="https://example.com/icon.png")
+        return embed.to_dict()
+
+    def bundled(category, row):
+        return {**bundle.get(row).embed, **branding}
+
+    print(f"{len(bundle)} bundled responses")
+    print(f"{'mode':<8}{'per lookup us':>15}")
+    for name, fn in (("built", built), ("bundle", bundled)):
+        print(f"{name:<8}{time_per_row(fn, rows, args.repeat):>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
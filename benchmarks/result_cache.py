@@ -0,0 +1,61 @@
+"""Hit ratio and preparation time saved by the ResultCache on a skewed stream of queries.
+
+Queries follow a popularity curve over every item name, so a few items ("rivers of blood",
+"malenia") are asked for constantly and most rarely. A miss prepares the way a handler
+does: index search, detail fields and serialization.
+
+Run from the repository root:
+
+    python -m benchmarks.result_cache [--requests N] [--entries N ...]
+"""
+import argparse
+import json
+import random
+import time
+
+from result_cache import ResultCache
+from schemas import categories
+from search_index import normalize_name
+from snapshot import load_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--entries", type=int, nargs="+", default=[0, 64, 256, 2048])
+    args = parser.parse_args()
+
+    state = load_state()
+    indexes = {**state["name_indexes"], **state["boss_indexes"]}
+    queries = [
+        (category, name)
+        for category in categories
+        for name in indexes[category.key].names if isinstance(name, str)
+    ]
+    random.seed(0)
+    random.shuffle(queries)
+    weights = [1 / rank for rank in range(1, len(queries) + 1)]
+    stream = random.choices(queries, weights, k=args.requests)
+
+    def prepare(category, name):
+        rows = indexes[category.key].search(name)
+        return json.dumps([category.detail_fields(row) for row in rows[:1]] or [category.summary_field(row) for row in rows])
+
+    print(f"{'entries':>8}{'hit ratio':>11}{'mean us':>10}{'saved ms':>10}{'MB':>7}")
+    for entries in args.entries:
+        cache = ResultCache(state["version"], max_entries=entries)
+        start = time.perf_counter()
+        for category, name in stream:
+            key = (cache.version, category.command, normalize_name(name), "full")
+            if cache.get(key) is None:
+                prepared = time.perf_counter()
+                payload = prepare(category, name)
+                cache.put(key, payload, time.perf_counter() - prepared)
+        elapsed = time.perf_counter() - start
+        ratio = cache.hits / (cache.hits + cache.misses)
+        print(f"{entries:>8}{ratio:>11.1%}{elapsed / len(stream) * 1e6:>10.1f}"
+              f"{cache.saved_seconds * 1e3:>10.1f}{cache.size / 2 ** 20:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
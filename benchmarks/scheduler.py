@@ -0,0 +1,115 @@
+"""Missed acknowledgements under a burst: a plain FIFO limit vs. the deadline-aware Scheduler.
+
+A burst of simulated interactions arrives at once: most are cheap lookups, some are heavy
+renders. Both setups run at most --slots handlers at a time. Each fake interaction fails
+with Discord's "Unknown interaction" error when acknowledged after its 3 second deadline,
+which is what the bot would see.
+
+Run from the repository root:
+
+    python -m benchmarks.scheduler [--requests N] [--slots N] [--heavy-share F]
+"""
+import argparse
+import asyncio
+import random
+import types
+from collections import Counter
+
+import discord
+
+from scheduler import ACK_DEADLINE, UNKNOWN_INTERACTION, Scheduler
+
+CHEAP_SECONDS = 0.05
+HEAVY_SECONDS = 0.8
+
+
+def unknown_interaction():
+    return discord.NotFound(types.SimpleNamespace(status=404, reason="Not Found"),
+                            {"code": UNKNOWN_INTERACTION, "message": "Unknown interaction"})
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def acknowledge(self):
+        if asyncio.get_running_loop().time() > self.interaction.deadline:
+            raise unknown_interaction()
+        self.done = True
+
+    async def defer(self, **kwargs):
+        await self.acknowledge()
+
+    async def send_message(self, **kwargs):
+        await self.acknowledge()
+
+
+class FakeInteraction:
+    def __init__(self, number):
+        self.id = number
+        self.created_at = discord.utils.utcnow()
+        self.deadline = asyncio.get_running_loop().time() + ACK_DEADLINE
+        self.response = FakeResponse(self)
+
+    async def edit_original_response(self, **kwargs):
+        pass
+
+
+async def handler(interaction, seconds):
+    await asyncio.sleep(seconds)
+    if interaction.response.is_done():
+        await interaction.edit_original_response()
+    else:
+        await interaction.response.send_message()
+
+
+async def fifo(slots, burst):
+    semaphore = asyncio.Semaphore(slots)
+    missed = Counter()
+
+    async def run(interaction, seconds):
+        async with semaphore:
+            try:
+                await handler(interaction, seconds)
+            except discord.NotFound:
+                missed["missed acks"] += 1
+
+    await asyncio.gather(*(run(FakeInteraction(number), seconds) for number, seconds in enumerate(burst)))
+    return missed
+
+
+async def scheduled(slots, burst):
+    scheduler = Scheduler(slots=slots, max_queue=len(burst))
+    cheap = scheduler.schedule("cheap")(handler)
+    heavy = scheduler.schedule("heavy")(handler)
+    # Prime the cost history as a running bot would have it.
+    for _ in range(10):
+        scheduler.record("cheap", CHEAP_SECONDS)
+        scheduler.record("heavy", HEAVY_SECONDS)
+    await asyncio.gather(*(
+        (heavy if seconds == HEAVY_SECONDS else cheap)(FakeInteraction(number), seconds)
+        for number, seconds in enumerate(burst)
+    ))
+    return scheduler.counters
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--slots", type=int, default=8)
+    parser.add_argument("--heavy-share", type=float, default=0.2)
+    args = parser.parse_args()
+
+    random.seed(0)
+    burst = [HEAVY_SECONDS if random.random() < args.heavy_share else CHEAP_SECONDS for _ in range(args.requests)]
+    for name, run in (("FIFO", fifo), ("Scheduler", scheduled)):
+        counters = await run(args.slots, burst)
+        print(f"{name:<10}" + ", ".join(f"{key} {value}" for key, value in sorted(counters.items())))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Duplicate work under a burst of identical lookups, with and without single-flight coalescing.
+
+--burst concurrent requests for the same item each search the name index and build the
+detail fields in the thread pool, the way a viral /boss query does.
+
+Run from the repository root:
+
+    python -m benchmarks.single_flight [--burst N] [--query TEXT]
+"""
+import argparse
+import asyncio
+import time
+
+from schemas import categories
+from single_flight import SingleFlight
+from snapshot import load_state
+from workers import Workers
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--query", default="bayle")
+    args = parser.parse_args()
+
+    state = load_state()
+    bosses = next(category for category in categories if category.key == "bosses")
+    index = state["name_indexes"]["bosses"]
+    workers = Workers()
+    computations = 0
+
+    async def prepare():
+        nonlocal computations
+        computations += 1
+        rows = await workers.run(index.search, args.query)
+        return [bosses.detail_fields(row) for row in rows]
+
+    async def direct():
+        return await prepare()
+
+    flights = SingleFlight()
+
+    async def coalesced():
+        return await flights.run(("boss", args.query, "full"), prepare)
+
+    print(f"{'mode':<14}{'computed':>10}{'total ms':>10}")
+    for name, lookup in (("direct", direct), ("single flight", coalesced)):
+        computations = 0
+        start = time.perf_counter()
+        await asyncio.gather(*(lookup() for _ in range(args.burst)))
+        print(f"{name:<14}{computations:>10}{(time.perf_counter() - start) * 1e3:>10.1f}")
+    print(flights.stats())
+    workers.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
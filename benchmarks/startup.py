@@ -0,0 +1,50 @@
+"""Bot data startup time: parsing the CSVs and building indexes vs. mapping the compiled snapshot.
+
+Each path runs in a fresh interpreter, including its imports.
+
+Run from the repository root:
+
+    python -m benchmarks.startup [--runs N]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+def child(path):
+    start = time.perf_counter()
+    if path == "csv":
+        from snapshot import build_state
+        build_state()
+    else:
+        from snapshot import read_snapshot, snapshot_digest
+        if read_snapshot(snapshot_digest()) is None:
+            sys.exit("eldenring.snapshot is missing or stale; run python snapshot.py first")
+    print(json.dumps({"seconds": time.perf_counter() - start}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=["csv", "snapshot"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    print(f"{'path':<10}{'best ms':>10}{'median ms':>11}")
+    for path in ("csv", "snapshot"):
+        timings = sorted(
+            json.loads(subprocess.check_output(
+                [sys.executable, "-m", "benchmarks.startup", "--child", path], stderr=subprocess.DEVNULL
+            ).splitlines()[-1])["seconds"] * 1e3
+            for _ in range(args.runs)
+        )
+        print(f"{path:<10}{timings[0]:>10.1f}{timings[len(timings) // 2]:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Substring lookup latency as the indexed corpus grows: regex scan vs. trigram postings.
+
+Run from the repository root:
+
+    python -m benchmarks.substring_index [--repeat N]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from data import csv_files, load_dataframes, load_reference_dataframes
+from records import Table
+from search_index import NameIndex
+
+queries = ["moon", "blood", "dragon", "ash of war", "[3]", "golden vow", "malenia", "zzzz"]
+
+
+def time_per_query(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    frames = list(load_dataframes().values())
+    base = pd.concat([frame[['name']] for frame in frames], ignore_index=True)
+    wired = pd.concat([base] + [frame[['name']] for frame in load_reference_dataframes().values()], ignore_index=True)
+
+    corpora = [
+        (f"{len(csv_files)} categories", base),
+        ("+ npcs/creatures/locations", wired),
+        ("x4 synthetic", pd.concat([wired] * 4, ignore_index=True)),
+        ("x16 synthetic", pd.concat([wired] * 16, ignore_index=True)),
+    ]
+
+    print(f"{'corpus':<30}{'rows':>7}{'regex scan us':>15}{'trigram us':>12}")
+    for label, frame in corpora:
+        index = NameIndex(Table(label, ['name'], [frame['name'].tolist()]))
+        names = frame['name']
+        regex = time_per_query(lambda query: names.str.contains(query, case=False, na=False, regex=True), args.repeat)
+        trigram = time_per_query(lambda query: index.lookup(query, exact=False), args.repeat)
+        print(f"{label:<30}{len(frame):>7}{regex:>15.1f}{trigram:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
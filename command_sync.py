@@ -0,0 +1,55 @@
+"""Sync the slash command tree with Discord only when its definitions changed.
+
+on_ready fires again after every gateway reconnect, and each sync re-uploads every command
+against the application-command rate limit. The tree's payload is hashed the way sync()
+would send it and compared with the hash recorded at the last successful sync. Delete
+command_sync.json to force the next start to sync.
+"""
+import hashlib
+import json
+import os
+import time
+
+COMMAND_SYNC_PATH = 'command_sync.json'
+
+
+def tree_hash(tree):
+    """sha256 of the command payloads sync() would upload, independent of registration order."""
+    payload = sorted((command.to_dict(tree) for command in tree.get_commands()), key=lambda command: command["name"])
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def read_synced(path=COMMAND_SYNC_PATH):
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def write_synced(record, path=COMMAND_SYNC_PATH):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'w', encoding='utf-8') as file:
+        json.dump(record, file)
+    os.replace(temporary_path, path)
+
+
+async def sync_if_changed(tree, application_id, path=COMMAND_SYNC_PATH):
+    """Sync the tree when its hash differs from the last sync for this application; True when it synced."""
+    digest = tree_hash(tree)
+    synced = read_synced(path)
+    if synced is None:
+        reason = "no sync recorded"
+    elif synced.get("application_id") != application_id:
+        reason = "different application"
+    elif synced.get("hash") != digest:
+        reason = "command definitions changed"
+    else:
+        print(f"Command tree unchanged ({digest[:12]}), skipping sync")
+        return False
+
+    start = time.perf_counter()
+    commands = await tree.sync()
+    write_synced({"application_id": application_id, "hash": digest, "synced_at": time.time()}, path)
+    print(f"Synced {len(commands)} commands in {(time.perf_counter() - start) * 1e3:.0f} ms ({reason}, {digest[:12]})")
+    return True
@@ -0,0 +1,122 @@
+"""Side-by-side comparison cards for /compare, drawn with Pillow and cached on disk.
+
+A card's key hashes the layout version, the data version and the compared rows, so a
+repeated comparison is served from the cache (or from the Discord CDN) without drawing
+anything, and any data change produces new cards instead of stale ones.
+"""
+import hashlib
+import json
+import os
+import threading
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+CARDS_PATH = 'cards'
+# Bump whenever the card layout changes, so cached cards are redrawn.
+CARD_VERSION = 1
+
+COLUMN_WIDTH = 380
+IMAGE_SIZE = (220, 220)
+PADDING = 20
+BACKGROUND = (30, 27, 22)
+GOLD = (190, 165, 111)
+TEXT = (230, 225, 214)
+MUTED = (150, 142, 128)
+
+
+def card_key(category, rows, version):
+    names = [row['name'] for row in rows]
+    return hashlib.sha256(json.dumps([CARD_VERSION, version, category.key, names]).encode()).hexdigest()
+
+
+def card_path(key):
+    return os.path.join(CARDS_PATH, f"{key}.png")
+
+
+def wrap(draw, text, font, width):
+    """Lines of text, each at most width pixels wide."""
+    lines = []
+    for paragraph in str(text).split("\n"):
+        words = paragraph.split()
+        line = ""
+        for word in words:
+            candidate = f"{line} {word}".strip()
+            if line and draw.textlength(candidate, font=font) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+def save_png(image, path):
+    """Write image to path as a PNG, atomically, so a reader never sees a partly written file."""
+    buffer = BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Renders of the same image in two threads or worker processes must not share a temporary file.
+    temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary_path, 'wb') as file:
+        file.write(buffer.getvalue())
+    os.replace(temporary_path, path)
+
+
+def load_picture(path):
+    """The first frame of the image at path, scaled to fit IMAGE_SIZE, or None without one."""
+    if path is None:
+        return None
+    with Image.open(path) as image:
+        image.seek(0)
+        picture = image.convert("RGBA")
+    picture.thumbnail(IMAGE_SIZE)
+    return picture
+
+
+def render_card(columns, path):
+    """Draw one column per (title, image path, [(label, value)]) and write the PNG to path."""
+    title_font = ImageFont.load_default(size=22)
+    label_font = ImageFont.load_default(size=15)
+    value_font = ImageFont.load_default(size=17)
+    measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    text_width = COLUMN_WIDTH - 2 * PADDING
+    line_height = 22
+
+    # Stats line up across columns: each row is as tall as its longest value.
+    titles = [wrap(measure, title, title_font, text_width) for title, _, _ in columns]
+    labels = [label for label, _ in columns[0][2]]
+    values = [[wrap(measure, value, value_font, text_width) for _, value in stats] for _, _, stats in columns]
+    title_height = max(map(len, titles)) * 28
+    row_heights = [18 + max(len(column[row]) for column in values) * line_height + 12 for row in range(len(labels))]
+
+    width = COLUMN_WIDTH * len(columns)
+    height = PADDING + IMAGE_SIZE[1] + PADDING + title_height + 10 + sum(row_heights) + PADDING
+    card = Image.new("RGB", (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(card)
+
+    for index, (_, image_path, _) in enumerate(columns):
+        left = index * COLUMN_WIDTH
+        if index:
+            draw.line([(left, PADDING), (left, height - PADDING)], fill=MUTED, width=1)
+
+        picture = load_picture(image_path)
+        if picture is not None:
+            offset = (left + (COLUMN_WIDTH - picture.width) // 2, PADDING + (IMAGE_SIZE[1] - picture.height) // 2)
+            card.paste(picture, offset, picture)
+
+        top = PADDING + IMAGE_SIZE[1] + PADDING
+        for line in titles[index]:
+            draw.text((left + PADDING, top), line, font=title_font, fill=GOLD)
+            top += 28
+        top = PADDING + IMAGE_SIZE[1] + PADDING + title_height + 10
+
+        for row, label in enumerate(labels):
+            draw.text((left + PADDING, top), label.upper(), font=label_font, fill=MUTED)
+            line_top = top + 18
+            for line in values[index][row]:
+                draw.text((left + PADDING, line_top), line, font=value_font, fill=TEXT)
+                line_top += line_height
+            top += row_heights[row]
+
+    save_png(card, path)
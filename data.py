@@ -0,0 +1,100 @@
+import ast
+
+csv_files = {
+    "ashesOfWar": 'eldenringScrap/ashesOfWar.csv',
+    "armors": 'eldenringScrap/armors.csv',
+    "bosses": 'eldenringScrap/bosses.csv',
+    "incantations": 'eldenringScrap/incantations.csv',
+    "shields": 'eldenringScrap/shields.csv',
+    "skills": 'eldenringScrap/skills.csv',
+    "sorceries": 'eldenringScrap/sorceries.csv',
+    "spiritAshes": 'eldenringScrap/spiritAshes.csv',
+    "talismans": 'eldenringScrap/talismans.csv',
+    "weapons": 'eldenringScrap/weapons.csv',
+    "remembrances": 'eldenringScrap/items/remembrances.csv',
+    "consumables": 'eldenringScrap/items/consumables.csv',
+    "crystalTears": 'eldenringScrap/items/crystalTears.csv',
+    "greatRunes": 'eldenringScrap/items/greatRunes.csv',
+    "cookbooks": 'eldenringScrap/items/cookbooks.csv',
+    "keyitems": 'eldenringScrap/items/keyItems.csv',
+    "materials": 'eldenringScrap/items/materials.csv',
+    "multi": 'eldenringScrap/items/multi.csv',
+    "tools": 'eldenringScrap/items/tools.csv',
+    "upgradeMaterials": 'eldenringScrap/items/upgradeMaterials.csv',
+    "whetblades": 'eldenringScrap/items/whetblades.csv',
+    "bells": 'eldenringScrap/items/bells.csv',
+}
+
+reference_csv_files = {
+    "npcs": 'eldenringScrap/npcs.csv',
+    "creatures": 'eldenringScrap/creatures.csv',
+    "locations": 'eldenringScrap/locations.csv',
+}
+
+# Columns stored as Python literals in the CSVs, and the container type each one is parsed into.
+literal_columns = {
+    "armors": {"damage negation": list, "resistance": list},
+    "weapons": {"requirements": list},
+    "shields": {"requirements": list},
+    "bosses": {"Locations & Drops": dict},
+    "cookbooks": {"required for": list},
+    "creatures": {"locations": list, "drops": list},
+    "locations": {"items": list, "npcs": list, "creatures": list, "bosses": list},
+}
+
+
+def parse_literal(value, kind):
+    if not isinstance(value, str):
+        return kind()
+
+    parsed = ast.literal_eval(value)
+    if kind is list and isinstance(parsed, dict):
+        parsed = [parsed]
+    if not isinstance(parsed, kind):
+        raise ValueError(f"expected {kind.__name__}, got {type(parsed).__name__}")
+    return parsed
+
+
+def report_problems(problems):
+    if problems:
+        print(f"{len(problems)} value(s) could not be parsed and were kept as plain text:")
+        for problem in problems:
+            print(f"  {problem}")
+
+
+def parse_literal_column(category, column, names, values):
+    kind = literal_columns[category][column]
+    parsed = []
+    problems = []
+    for name, value in zip(names, values):
+        try:
+            parsed.append(parse_literal(value, kind))
+        except (ValueError, SyntaxError) as e:
+            problems.append(f"{category} / {name} / {column}: {e}")
+            parsed.append([value] if kind is list else {})
+    return parsed, problems
+
+
+def read_csv_files(files):
+    import pandas as pd
+
+    dataframes = {}
+    problems = []
+    for category, path in files.items():
+        df = pd.read_csv(path)
+        for column in literal_columns.get(category, {}):
+            values, column_problems = parse_literal_column(category, column, df['name'], df[column])
+            df[column] = pd.Series(values, index=df.index, dtype=object)
+            problems += column_problems
+        dataframes[category] = df
+
+    report_problems(problems)
+    return dataframes
+
+
+def load_dataframes():
+    return read_csv_files(csv_files)
+
+
+def load_reference_dataframes():
+    return read_csv_files(reference_csv_files)
@@ -0,0 +1,108 @@
+"""Optional SQLite FTS5 backend that ranks every category by BM25 over names, descriptions and effects.
+
+Enabled with SEARCH_BACKEND=fts. The database is a local file rebuilt whenever it was
+built from different CSV contents or by different code, so both building and querying
+work fully offline.
+"""
+import hashlib
+import sqlite3
+
+from search_index import FULL_TEXT, SearchHit, normalize_name
+
+FTS_PATH = 'eldenring.sqlite'
+
+# Indexed text columns, in the order bm25() weights are given.
+TEXT_COLUMNS = {
+    "name": "name",
+    "description": "description",
+    "effect": "effect",
+    "passive_effect": "passive effect",
+}
+COLUMN_WEIGHTS = (10.0, 1.0, 2.0, 2.0)
+# The schema, tokenizer and indexed columns, and the parsing that orders the rows, so changing them rebuilds the index.
+BUILD_SOURCES = ('fts_search.py', 'records.py', 'data.py')
+
+
+def build_digest(digest):
+    """digest, the CSV contents' hash, combined with the build sources."""
+    combined = hashlib.sha256(digest)
+    for path in BUILD_SOURCES:
+        with open(path, 'rb') as file:
+            combined.update(file.read())
+    return combined.digest()
+
+
+def fts_query(search_value):
+    """Quote every word of the user's text so nothing in it is read as FTS5 syntax; the last word is a prefix."""
+    words = normalize_name(search_value).split()
+    if not words:
+        return None
+    terms = ['"{}"'.format(word.replace('"', '""')) for word in words]
+    terms[-1] += "*"
+    return " AND ".join(terms)
+
+
+class FullTextIndex:
+    def __init__(self, tables, digest, path=FTS_PATH):
+        self.tables = tables
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        digest = build_digest(digest)
+        if self.stored_digest() != digest.hex():
+            self.rebuild(digest)
+
+    def stored_digest(self):
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def rebuild(self, digest):
+        columns = ", ".join(TEXT_COLUMNS)
+        with self.connection:
+            self.connection.execute("DROP TABLE IF EXISTS entries")
+            self.connection.execute("DROP TABLE IF EXISTS meta")
+            self.connection.execute(
+                f"CREATE VIRTUAL TABLE entries USING fts5({columns}, category UNINDEXED, position UNINDEXED, "
+                f"tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            self.connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.connection.executemany(
+                f"INSERT INTO entries ({columns}, category, position) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    [self.text(row, column) for column in TEXT_COLUMNS.values()] + [category, position]
+                    for category, table in self.tables.items()
+                    for position, row in enumerate(table)
+                ),
+            )
+            self.connection.execute("INSERT INTO meta VALUES ('digest', ?)", (digest.hex(),))
+
+    @staticmethod
+    def text(row, column):
+        value = row.get(column)
+        return value if isinstance(value, str) else ""
+
+    def search(self, search_value, category=None, limit=None):
+        """SearchHits for rows matching every word of search_value, ranked by BM25, all of them unless limited.
+
+        Like the name index, every match is returned by default, so the result count the embeds
+        report is the real one and paging can reach all of them.
+        """
+        query = fts_query(search_value)
+        if query is None:
+            return []
+
+        sql = "SELECT category, position, name FROM entries WHERE entries MATCH ?"
+        parameters = [query]
+        if category is not None:
+            sql += " AND category = ?"
+            parameters.append(category)
+        sql += f" ORDER BY bm25(entries, {', '.join(map(str, COLUMN_WEIGHTS))})"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+
+        return [SearchHit(*row, FULL_TEXT) for row in self.connection.execute(sql, parameters)]
+
+    def search_rows(self, search_value, category):
+        return [self.tables[category][hit.position] for hit in self.search(search_value, category)]
@@ -0,0 +1,35 @@
+"""Per-guild preferences, kept in a local SQLite file and mirrored in memory for lookups.
+
+Changes take effect in memory at once and are written to disk by save(), which callers run
+off the event loop.
+"""
+import sqlite3
+import threading
+
+GUILD_SETTINGS_PATH = 'guild_settings.sqlite'
+RENDER_PROFILES = ("full", "thumbnail", "text")
+
+
+class GuildSettings:
+    def __init__(self, default_render_profile="full", path=GUILD_SETTINGS_PATH):
+        self.default_render_profile = default_render_profile if default_render_profile in RENDER_PROFILES else "full"
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS render_profiles (guild_id INTEGER PRIMARY KEY, profile TEXT NOT NULL)"
+            )
+        self.render_profiles = dict(self.connection.execute("SELECT guild_id, profile FROM render_profiles"))
+        # Saves run in worker threads and share the one connection.
+        self.lock = threading.Lock()
+
+    def render_profile(self, guild_id):
+        return self.render_profiles.get(guild_id, self.default_render_profile)
+
+    def set_render_profile(self, guild_id, profile):
+        """Use profile for the guild from now on; save() persists it."""
+        self.render_profiles[guild_id] = profile
+
+    def save(self, guild_id, profile):
+        """Write the guild's profile to the SQLite file. Blocking, so run it in a worker thread."""
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO render_profiles VALUES (?, ?)", (guild_id, profile))
@@ -0,0 +1,68 @@
+"""Byte-budgeted LRU of image file contents, read off the event loop.
+
+Hot images are served from memory; a miss reads and hashes the file in a worker thread so
+a slow disk never stalls other interactions. Files are assumed not to change while the bot
+runs, as with the data snapshot.
+"""
+import asyncio
+import hashlib
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+CachedImage = namedtuple("CachedImage", "data digest")
+
+
+def read_image(path):
+    """The file's bytes and sha256, or None when it does not exist."""
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    return CachedImage(data, hashlib.sha256(data).hexdigest())
+
+
+class ImageCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, path):
+        image = self.entries.get(path)
+        if image is not None:
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = await asyncio.to_thread(read_image, path)
+        if image is not None:
+            self.put(path, image)
+        return image
+
+    def put(self, path, image):
+        # An image larger than the whole budget would only evict everything else and then itself.
+        if len(image.data) > self.max_bytes:
+            return
+
+        previous = self.entries.pop(path, None)
+        if previous is not None:
+            self.size -= len(previous.data)
+        self.entries[path] = image
+        self.size += len(image.data)
+
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted.data)
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups if lookups else 0.0
+        return (f"image cache: {len(self.entries)} images, {self.size / 2 ** 20:.1f} of {self.max_bytes / 2 ** 20:.0f} MB, "
+                f"{self.hits} hits / {self.misses} misses ({ratio:.0%}), {self.evictions} evictions")
@@ -0,0 +1,110 @@
+"""Every row's local image resolved, verified and hashed once, when the data snapshot is built.
+
+Handlers look an image up by (category, CSV image URL) instead of rebuilding and checking
+paths per request. Images are addressed by content: files with identical bytes resolve to
+one canonical entry, so they are held in the image cache and uploaded to Discord once, and
+their variants are encoded once into the shared images/store/ folder. The original files
+stay in their per-category folders, duplicates included. List the rows whose image could
+not be found, what deduplication saves in memory and uploads, and what storing the
+originals by content would save on disk, with:
+
+    python image_manifest.py
+"""
+import hashlib
+import os
+from collections import namedtuple
+
+IMAGES_ROOT = 'images'
+# Content-addressed files shared by every category, such as the encoded variants.
+STORE_FOLDER = 'store'
+
+ImageEntry = namedtuple("ImageEntry", "path size digest")
+UnresolvedImage = namedtuple("UnresolvedImage", "category name path")
+
+
+def image_folders(root=IMAGES_ROOT):
+    """Names of the per-category folders under root."""
+    return [
+        folder for folder in sorted(os.listdir(root))
+        if folder != STORE_FOLDER and os.path.isdir(os.path.join(root, folder))
+    ]
+
+
+def resolve_image(path):
+    """The file's ImageEntry, or None when it does not exist."""
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    return ImageEntry(path, len(data), hashlib.sha256(data).hexdigest())
+
+
+class ImageManifest:
+    def __init__(self, tables, categories):
+        self.entries = {}
+        self.unresolved = []
+        # Every path rows refer to, mapped to the canonical entry for its contents.
+        self.paths = {}
+        contents = {}
+        for category in categories:
+            for row in tables[category.key]:
+                path = category.image(row)
+                if path is None:
+                    continue
+                if path not in self.paths:
+                    entry = resolve_image(path)
+                    self.paths[path] = entry if entry is None else contents.setdefault(entry.digest, entry)
+                if self.paths[path] is None:
+                    self.unresolved.append(UnresolvedImage(category.key, row['name'], path))
+                else:
+                    self.entries[category.key, row['image']] = self.paths[path]
+
+    def get(self, category, image_url):
+        return self.entries.get((category, image_url))
+
+    def report(self):
+        lines = [f"{len(self.unresolved)} rows have no image file:"]
+        lines += [f"  {image.category}: {image.name} ({image.path})" for image in self.unresolved]
+        return "\n".join(lines)
+
+    def savings(self):
+        """Bytes the images rows refer to take when kept per path vs. once per content."""
+        entries = [entry for entry in self.paths.values() if entry is not None]
+        return sum(entry.size for entry in entries), sum(entry.size for entry in set(entries))
+
+
+def disk_savings(root=IMAGES_ROOT):
+    """(files, distinct contents, bytes, bytes if each content were stored once) for the category folders' files."""
+    sizes = {}
+    files = total = 0
+    for folder in image_folders(root):
+        with os.scandir(os.path.join(root, folder)) as entries:
+            for entry in map(resolve_image, (f"{root}/{folder}/{file.name}" for file in entries if file.is_file())):
+                files += 1
+                total += entry.size
+                sizes[entry.digest] = entry.size
+    return files, len(sizes), total, sum(sizes.values())
+
+
+def print_savings(manifest):
+    def line(label, before, after, detail="", saves="saves"):
+        print(f"  {label:<22}{before / 2 ** 20:>9.2f} MB -> {after / 2 ** 20:>7.2f} MB, "
+              f"{saves} {(before - after) / 2 ** 20:.2f} MB{detail}")
+
+    files, contents, total, deduplicated = disk_savings()
+    referenced, distinct = manifest.savings()
+    print("Content-addressed deduplication:")
+    # The originals are not deduplicated on disk, only their variants in images/store/.
+    line("disk (images/)", total, deduplicated, f" ({files} files, {contents} distinct), if stored by content",
+         saves="could save")
+    line("memory cache, all hot", referenced, distinct)
+    line("first uploads", referenced, distinct)
+
+
+if __name__ == "__main__":
+    from snapshot import load_state
+
+    state_manifest = load_state()["image_manifest"]
+    print(state_manifest.report())
+    print_savings(state_manifest)
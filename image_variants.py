@@ -0,0 +1,241 @@
+"""Size-optimized variants of everything under images/ and the manifest the bot picks them from.
+
+Build them after adding or changing images (needs Pillow):
+
+    python image_variants.py [--jobs N]
+
+Every distinct image gets up to three variants in the content-addressed images/store/ folder,
+named after the sha256 of the source, so identical files in different folders share them:
+
+    animated   animated WebP, for animated GIFs
+    still      the first frame as WebP
+    thumbnail  the first frame scaled down to THUMBNAIL_SIZE, as WebP
+
+A variant is only kept when it is smaller than the original. images/variants.json records
+every image with its variants; the bot sends the smallest file its IMAGE_PROFILE allows and
+sends the original when an image has no usable variant or there is no manifest at all.
+"""
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from image_manifest import IMAGES_ROOT, STORE_FOLDER, image_folders, resolve_image
+
+MANIFEST_PATH = 'images/variants.json'
+# Bump whenever the variants or the manifest layout change, so old manifests are rebuilt.
+MANIFEST_VERSION = 2
+IMAGE_EXTENSIONS = ('.gif', '.jpeg', '.jpg', '.png', '.webp')
+THUMBNAIL_SIZE = (160, 160)
+
+# Variants each profile may send instead of the original. The original is always allowed.
+QUALITY_PROFILES = {
+    "full": ("animated",),
+    "still": ("animated", "still"),
+    "thumbnail": ("animated", "still", "thumbnail"),
+}
+
+
+def source_images(root=IMAGES_ROOT):
+    for folder in image_folders(root):
+        directory = os.path.join(root, folder)
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(os.path.join(directory, name)):
+                yield f"{root}/{folder}/{name}"
+
+
+def variant_path(digest, kind, root=IMAGES_ROOT):
+    return f"{root}/{STORE_FOLDER}/{digest}.{kind}.webp"
+
+
+def encode_variants(path, digest):
+    """Write the variants of one image to the store and return the ones smaller than the original."""
+    from PIL import Image
+
+    size = os.path.getsize(path)
+    variants = {}
+    os.makedirs(os.path.join(IMAGES_ROOT, STORE_FOLDER), exist_ok=True)
+
+    with Image.open(path) as image:
+        encoded = {}
+        if getattr(image, "is_animated", False):
+            # An explicit background avoids Pillow failing on GIFs without a global palette.
+            encoded["animated"] = lambda target: image.save(
+                target, 'WEBP', save_all=True, background=(0, 0, 0, 0), quality=70, method=4
+            )
+
+        image.seek(0)
+        first_frame = image.convert("RGBA" if image.mode in ("P", "RGBA", "LA") else "RGB")
+        thumbnail = first_frame.copy()
+        thumbnail.thumbnail(THUMBNAIL_SIZE)
+        encoded["still"] = lambda target: first_frame.save(target, 'WEBP', quality=80, method=4)
+        encoded["thumbnail"] = lambda target: thumbnail.save(target, 'WEBP', quality=75, method=4)
+
+        for kind, save in encoded.items():
+            target = variant_path(digest, kind)
+            save(target)
+            variant_size = os.path.getsize(target)
+            if variant_size < size:
+                variants[kind] = {"path": target, "size": variant_size}
+            else:
+                os.remove(target)
+
+    return variants
+
+
+def is_current(path, entry):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return (
+        entry["size"] == stat.st_size
+        and entry["mtime_ns"] == stat.st_mtime_ns
+        and all(os.path.exists(variant["path"]) for variant in entry["variants"].values())
+    )
+
+
+def read_manifest(path=MANIFEST_PATH):
+    """The manifest's images, or {} when it is missing or from another MANIFEST_VERSION."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest["images"]
+
+
+def write_manifest(images, path=MANIFEST_PATH):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'w', encoding='utf-8') as file:
+        json.dump({"version": MANIFEST_VERSION, "images": images}, file, indent=1, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def build_manifest(root=IMAGES_ROOT, jobs=None, previous=None):
+    """Manifest entries for every image under root, encoding each changed content only once."""
+    previous = previous or {}
+    images = {}
+    variants = {}
+    stale = {}
+    for path in source_images(root):
+        entry = previous.get(path)
+        if entry is not None and is_current(path, entry):
+            images[path] = entry
+            variants.setdefault(entry["digest"], entry["variants"])
+        else:
+            stat = os.stat(path)
+            digest = resolve_image(path).digest
+            images[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+            stale.setdefault(digest, path)
+
+    pending = [(digest, path) for digest, path in stale.items() if digest not in variants]
+    with ProcessPoolExecutor(jobs) as executor:
+        encoded = executor.map(encode_variants, [path for _, path in pending], [digest for digest, _ in pending])
+        for (digest, path), kinds in zip(pending, encoded):
+            variants[digest] = kinds
+            sizes = ", ".join(f"{kind} {variant['size']}" for kind, variant in kinds.items())
+            print(f"  {path}: {images[path]['size']} -> {sizes or 'kept original'}")
+
+    for entry in images.values():
+        entry["variants"] = variants[entry["digest"]]
+    remove_orphans(images, root)
+    return dict(sorted(images.items())), len(pending)
+
+
+def remove_orphans(images, root=IMAGES_ROOT):
+    """Delete store files no image refers to any more."""
+    referenced = {variant["path"] for entry in images.values() for variant in entry["variants"].values()}
+    store = os.path.join(root, STORE_FOLDER)
+    if os.path.isdir(store):
+        for name in os.listdir(store):
+            if f"{root}/{STORE_FOLDER}/{name}" not in referenced:
+                os.remove(os.path.join(store, name))
+
+
+class ImageVariants:
+    def __init__(self, images):
+        self.images = images
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        """Only manifest entries whose source is unchanged and whose variants are all on disk are used."""
+        return cls({image: entry for image, entry in read_manifest(path).items() if is_current(image, entry)})
+
+    def pick(self, path, profile):
+        """The smallest file the profile allows in place of path."""
+        entry = self.images.get(path)
+        if entry is None:
+            return path
+
+        allowed = QUALITY_PROFILES.get(profile, ())
+        size, picked = entry["size"], path
+        for kind, variant in entry["variants"].items():
+            if kind in allowed and variant["size"] < size:
+                size, picked = variant["size"], variant["path"]
+        return picked
+
+    def report(self):
+        """Per category: image count, original bytes, and bytes sent under each profile."""
+        totals = defaultdict(lambda: defaultdict(int))
+        for path in self.images:
+            category = path.split('/')[1]
+            totals[category]["images"] += 1
+            totals[category]["original"] += self.images[path]["size"]
+            for profile in QUALITY_PROFILES:
+                totals[category][profile] += os.path.getsize(self.pick(path, profile))
+        return totals
+
+    def store_savings(self):
+        """Variant bytes when kept per image file vs. once per content in the store."""
+        per_content = {entry["digest"]: entry["variants"] for entry in self.images.values()}
+        per_file = [entry["variants"] for entry in self.images.values()]
+        return tuple(
+            sum(variant["size"] for kinds in variants for variant in kinds.values())
+            for variants in (per_file, per_content.values())
+        )
+
+
+def print_report(variants):
+    print(f"{'category':<18}{'images':>7}{'original MB':>13}" + "".join(f"{profile + ' MB':>14}{'saved':>7}" for profile in QUALITY_PROFILES))
+    overall = defaultdict(int)
+    for category, total in sorted(variants.report().items()):
+        for key, value in total.items():
+            overall[key] += value
+        print_report_row(category, total)
+    print_report_row("total", overall)
+
+    per_file, per_content = variants.store_savings()
+    print(f"Variant store: {per_content / 2 ** 20:.1f} MB once per content instead of {per_file / 2 ** 20:.1f} MB per file")
+
+
+def print_report_row(label, total):
+    row = f"{label:<18}{total['images']:>7}{total['original'] / 2 ** 20:>13.1f}"
+    for profile in QUALITY_PROFILES:
+        saved = 1 - total[profile] / total['original'] if total['original'] else 0
+        row += f"{total[profile] / 2 ** 20:>14.1f}{saved:>7.0%}"
+    print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=None, help="encoder processes (default: one per CPU)")
+    parser.add_argument("--report", action="store_true", help="only print the bytes-saved report")
+    args = parser.parse_args()
+
+    if not args.report:
+        start = time.perf_counter()
+        images, encoded = build_manifest(jobs=args.jobs, previous=read_manifest())
+        write_manifest(images)
+        print(f"Wrote {MANIFEST_PATH} ({len(images)} images, {encoded} re-encoded) "
+              f"in {time.perf_counter() - start:.1f} s")
+
+    print_report(ImageVariants.load())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,49 @@
+from collections import namedtuple
 from datetime import datetime
 from dotenv import load_dotenv
-from typing import Callable, Awaitable, Any
+from typing import Callable, Awaitable, Any, Literal, Optional
 from discord import Interaction
 
-import ast
+import asyncio
 import discord
+import io
 import os
-import pandas as pd
-import re
-from discord.ext import commands
+import time
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from attachment_cache import AttachmentCache
+from command_sync import sync_if_changed
+from compare_cards import card_key, card_path, render_card
+from fts_search import FullTextIndex
+from guild_settings import GuildSettings
+from image_cache import ImageCache
+from image_variants import ImageVariants
+from result_cache import ResultCache
+from result_pages import ResultPages
+from scheduler import Scheduler
+from schemas import categories
+from search_index import CORRECTED, EXACT, normalize_name
+from single_flight import SingleFlight
+from snapshot import load_state, source_hash
+from sprite_sheets import render_sheet, sheet_key, sheet_path
+from workers import LoopMonitor, Workers
 
 load_dotenv()
 
-csv_files = {
-    "ashesOfWar": 'eldenringScrap/ashesOfWar.csv',
-    "armors": 'eldenringScrap/armors.csv',
-    "bosses": 'eldenringScrap/bosses.csv',
-    "incantations": 'eldenringScrap/incantations.csv',
-    "shields": 'eldenringScrap/shields.csv',
-    "skills": 'eldenringScrap/skills.csv',
-    "sorceries": 'eldenringScrap/sorceries.csv',
-    "spiritAshes": 'eldenringScrap/spiritAshes.csv',
-    "talismans": 'eldenringScrap/talismans.csv',
-    "weapons": 'eldenringScrap/weapons.csv',
-    "remembrances": 'eldenringScrap/items/remembrances.csv',
-    "consumables": 'eldenringScrap/items/consumables.csv',
-    "crystalTears": 'eldenringScrap/items/crystalTears.csv',
-    "greatRunes": 'eldenringScrap/items/greatRunes.csv',
-    "cookbooks": 'eldenringScrap/items/cookbooks.csv',
-    "keyitems": 'eldenringScrap/items/keyitems.csv',
-    "materials": 'eldenringScrap/items/materials.csv',
-    "multi": 'eldenringScrap/items/multi.csv',
-    "tools": 'eldenringScrap/items/tools.csv',
-    "upgradeMaterials": 'eldenringScrap/items/upgradeMaterials.csv',
-    "whetblades": 'eldenringScrap/items/whetblades.csv',
-    "bells": 'eldenringScrap/items/bells.csv',
-}
+state = load_state()
+tables = state["tables"]
+name_indexes = state["name_indexes"]
+boss_indexes = state["boss_indexes"]
+global_index = state["global_index"]
+image_manifest = state["image_manifest"]
+response_bundle = state["response_bundle"]
+if image_manifest.unresolved:
+    print(f"{len(image_manifest.unresolved)} rows have no image file, run python image_manifest.py to list them")
 
-dataframes = {name: pd.read_csv(path) for name, path in csv_files.items()}
-
-df = dataframes["ashesOfWar"]
-armor_df = dataframes["armors"]
-boss_df = dataframes["bosses"]
-incantation_df = dataframes["incantations"]
-shields_df = dataframes['shields']
-skills_df = dataframes['skills']
-sorceries_df = dataframes['sorceries']
-spirit_ashes_df = dataframes['spiritAshes']
-talisman_df = dataframes['talismans']
-weapon_df = dataframes['weapons']
-remembrances_df = dataframes['remembrances']
-consumables_df = dataframes['consumables']
-crystalTears_df = dataframes['crystalTears']
-greatRunes_df = dataframes['greatRunes']
-cookbooks_df = dataframes['cookbooks']
-keyitems_df = dataframes['keyitems']
-materials_df = dataframes['materials']
-multi_df = dataframes['multi']
-tools_df = dataframes['tools']
-upgradeMaterials_df = dataframes['upgradeMaterials']
-whetblades_df = dataframes['whetblades']
-bells_df = dataframes['bells']
+for category in categories:
+    category.compile(tables[category.key].columns)
+categories_by_key = {category.key: category for category in categories}
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -68,6 +51,8 @@ intents.members = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 
 MAX_FIELDS_PER_EMBED = 10
+# Work still running after this many seconds defers the response, well inside Discord's 3 second limit.
+DEFER_AFTER = 1.0
 
 status_mapping = {
     "online": discord.Status.online,
@@ -84,34 +69,149 @@ ICON_URL = os.getenv('ICON_URL')
 FOOTER_TEXT = os.getenv('FOOTER_TEXT')
 AUTHOR_NAME = os.getenv('AUTHOR_NAME')
 NO_ITEMS_FOUND_IMAGE = os.getenv('NO_ITEMS_FOUND_IMAGE')
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'index').lower()
+IMAGE_PROFILE = os.getenv('IMAGE_PROFILE', 'full').lower()
+IMAGE_CACHE_MB = int(os.getenv('IMAGE_CACHE_MB', '64'))
+RENDER_PROFILE = os.getenv('RENDER_PROFILE', 'full').lower()
+RENDER_PROCESSES = int(os.getenv('RENDER_PROCESSES', '0'))
+RESULT_CACHE_ENTRIES = int(os.getenv('RESULT_CACHE_ENTRIES', '2048'))
+RESULT_CACHE_MB = int(os.getenv('RESULT_CACHE_MB', '16'))
+
+full_text_index = FullTextIndex(tables, source_hash()) if SEARCH_BACKEND == "fts" else None
+image_variants = ImageVariants.load()
+attachment_cache = AttachmentCache()
+image_cache = ImageCache(IMAGE_CACHE_MB * 2 ** 20)
+guild_settings = GuildSettings(RENDER_PROFILE)
+workers = Workers(processes=RENDER_PROCESSES)
+loop_monitor = LoopMonitor()
+scheduler = Scheduler()
+flights = SingleFlight()
+result_pages = ResultPages()
+result_cache = ResultCache(state["version"], RESULT_CACHE_ENTRIES, RESULT_CACHE_MB * 2 ** 20)
+
+RenderProfile = Literal["full", "thumbnail", "text"]
+
+# The parts of a detail embed the response bundle leaves out; the timestamp is replaced when it is sent.
+branding = discord.Embed(timestamp=datetime.now())
+branding.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
+branding.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
+EMBED_BRANDING = branding.to_dict()
+
+# A prepared response, independent of the interaction it answers so identical lookups can share it. The embed is
+# kept serialized once prepared. The image at image_path is uploaded on the first send and linked from the CDN
+# cache under image_key after that.
+# A multi-result payload also carries its ResultSet and page, for the paginated view.
+Payload = namedtuple(
+    "Payload", "embed image_path image_filename image_key thumbnail suggestions command display results page",
+    defaults=(None, None, None, False, None, None, None, None, 0)
+)
+# Every result of a search: the embed without fields, each result's (category, row, field) and the render profile.
+ResultSet = namedtuple("ResultSet", "embed items render_profile")
 
 
 @bot.event
 async def on_ready():
     print(f'Logged in as {bot.user}!')
+    loop_monitor.start()
+    if not report_health.is_running():
+        report_health.start()
     await bot.change_presence(status=DISCORD_STATUS,
                               activity=discord.Activity(type=discord.ActivityType.watching,
                                                         name=DISCORD_ACTIVITY_WATCHING))
-    await bot.tree.sync()
-
-
-def search_item_in_df(df_name, search_value):
-    try:
-        exact_match = df_name[df_name['name'].str.lower() == search_value.lower()]
-        if not exact_match.empty:
-            return exact_match
+    await sync_if_changed(bot.tree, bot.application_id)
+
+
+def search_item_in_df(category, search_value):
+    index = name_indexes[category]
+    if full_text_index is not None and normalize_name(search_value) not in index.exact:
+        results = full_text_index.search_rows(search_value, category)
+        if results:
+            return results
+    return index.search(search_value)
+
+
+def search_all_categories(search_value):
+    if full_text_index is not None and normalize_name(search_value) not in global_index.exact:
+        hits = full_text_index.search(search_value)
+        if hits:
+            return hits
+    return global_index.search(search_value)
+
+
+@tasks.loop(minutes=10)
+async def report_health():
+    print(loop_monitor.stats())
+    print(scheduler.stats())
+    print(flights.stats())
+    print(result_cache.stats())
+    print(image_cache.stats())
+
+
+async def defer_if_slow(interaction, awaitable):
+    """Await awaitable, deferring the response if it is still running after DEFER_AFTER."""
+    task = asyncio.ensure_future(awaitable)
+    done, _ = await asyncio.wait({task}, timeout=DEFER_AFTER)
+    if not done and not interaction.response.is_done():
+        await interaction.response.defer()
+    return await task
+
+
+async def answer(interaction, key, prepare, spellings=()):
+    """Send the Payload prepare() builds for key, (command, normalized query, render profile).
+
+    spellings are the queries as the user typed them, quoted back in place of their normalized forms.
+    """
+    payload = await defer_if_slow(interaction, prepare_once(key, prepare))
+    await send_payload(interaction, payload, spellings=spellings)
+
+
+async def prepare_once(key, prepare):
+    """The serialized Payload for key from the result cache, or prepared once for every concurrent lookup."""
+    cache_key = (result_cache.version, *key)
+    payload = result_cache.get(cache_key)
+    if payload is None:
+        payload = await flights.run(key, lambda: prepare_and_cache(cache_key, prepare))
+    return payload
+
+
+async def prepare_and_cache(cache_key, prepare):
+    start = time.perf_counter()
+    payload = serialized(await prepare())
+    result_cache.put(cache_key, payload, time.perf_counter() - start)
+    return payload
+
+
+def serialized(payload):
+    """The payload with its embed as a dict, the form payloads are shared, cached and sent in."""
+    if isinstance(payload.embed, discord.Embed):
+        return payload._replace(embed=payload.embed.to_dict())
+    return payload
+
+
+async def respond(interaction, edit=False, **kwargs):
+    """Send the response, or fill in the deferred one. With edit, replace the message a component belongs to."""
+    if edit or interaction.response.is_done():
+        file = kwargs.pop("file", None)
+        if file is not None:
+            kwargs["attachments"] = [file]
+        elif edit:
+            # An edited page or item without an upload must not keep showing the previous one.
+            kwargs["attachments"] = []
+    if interaction.response.is_done():
+        await interaction.edit_original_response(**kwargs)
+    elif edit:
+        await interaction.response.edit_message(**kwargs)
+    else:
+        await interaction.response.send_message(**kwargs)
 
-        results = df_name[df_name['name'].str.contains(search_value, case=False, na=False)]
-        return results
 
-    except re.error as e:
-        print(f"Regex error: {e}")
-        return pd.DataFrame()
+SearchCallback = Callable[[Interaction, str, Optional[RenderProfile]], Awaitable[Any]]
 
 
-def validate_item_name(min_length: int = 3) -> Callable[[Callable[[Interaction, str], Awaitable[Any]]], Callable[[Interaction, str], Awaitable[Any]]]:
-    def decorator(func: Callable[[Interaction, str], Awaitable[Any]]) -> Callable[[Interaction, str], Awaitable[Any]]:
-        async def wrapper(interaction: Interaction, item_name: str) -> Any:
+def validate_item_name(min_length: int = 3) -> Callable[[SearchCallback], SearchCallback]:
+    def decorator(func: SearchCallback) -> SearchCallback:
+        @app_commands.describe(display="Show the full image, a thumbnail, or text only (defaults to the server's setting)")
+        async def wrapper(interaction: Interaction, item_name: str, display: Optional[RenderProfile] = None) -> Any:
             if len(item_name) < min_length:
                 embed = discord.Embed(
                     title="Search Term Too Short",
@@ -122,1945 +222,450 @@ def validate_item_name(min_length: int = 3) -> Callable[[Callable[[Interaction,
                 embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
                 await interaction.response.send_message(embed=embed)
                 return
-            return await func(interaction, item_name)
+            return await func(interaction, item_name, display)
 
         return wrapper
 
     return decorator
 
 
-@bot.tree.command(name="ashe", description="Search for an Ashe Of War")
-@validate_item_name(min_length=3)
-async def ashe(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Items Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Affinity: {row['affinity']} | Skill: {row['skill']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            affinity = row['affinity']
-            skill = row['skill']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/ashesOfWar/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=f"**Affinity**: {affinity}\n**Skill**: {skill}\n\n**Description**: {description}",
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Items Found",
-            description=f"No items found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-def format_damage_negation(damage_negation_str):
-    try:
-        damage_negation_list = ast.literal_eval(damage_negation_str)
-        formatted_str = "\n".join([f"**{k}**: {v}" for item in damage_negation_list for k, v in item.items()])
-        return formatted_str
-    except Exception as e:
-        print(f"Error formatting damage negation: {e}")
-        return "N/A"
-
-
-def format_resistance(resistance_str):
-    try:
-        resistance_list = ast.literal_eval(resistance_str)
-        formatted_str = "\n".join([f"**{k}**: {v}" for item in resistance_list for k, v in item.items()])
-        return formatted_str
-    except Exception as e:
-        print(f"Error formatting resistance: {e}")
-        return "N/A"
-
-
-@bot.tree.command(name="armor", description="Search for an armor")
-@validate_item_name(min_length=3)
-async def armor(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(armor_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Items Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Weight: {row['weight']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            armor_type = row['type']
-            damage_negation = format_damage_negation(row['damage negation'])
-            resistance = format_resistance(row['resistance'])
-            weight = row['weight']
-            special_effect = row['special effect']
-            how_to_acquire = row['how to acquire']
-            in_game_section = row['in-game section']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/armors/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Type**: {armor_type}\n"
-                    f"**Weight**: {weight}\n"
-                    f"**Special Effect**: {special_effect if special_effect else 'None'}"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="**Damage Negation**",
-                value=damage_negation,
-                inline=True
-            )
-
-            embed.add_field(
-                name="**Resistance**",
-                value=resistance,
-                inline=True
-            )
-
-            embed.add_field(
-                name="\u200B",
-                value=f"**How to Acquire**: {how_to_acquire}\n**In-Game Section**: {in_game_section}",
-                inline=False
-            )
-
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Items Found",
-            description=f"No items found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="boss", description="Search for a boss")
-@validate_item_name(min_length=3)
-async def boss(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(boss_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
+class ResultsView(discord.ui.View):
+    """A menu opening one result of a stored ResultSet's page, with previous and next buttons when it has several."""
+
+    def __init__(self, key, result_set, page):
+        super().__init__(timeout=result_pages.ttl)
+        self.key = key
+        pages = (len(result_set.items) + MAX_FIELDS_PER_EMBED - 1) // MAX_FIELDS_PER_EMBED
+        first = page * MAX_FIELDS_PER_EMBED
+        if pages > 1:
+            self.add_page_buttons(page, pages)
+
+        select = discord.ui.Select(placeholder="Open a result", options=[
+            discord.SelectOption(label=f"{number}. {row['name']}"[:100], value=str(first + number - 1))
+            for number, (_, row, _) in enumerate(result_set.items[first:first + MAX_FIELDS_PER_EMBED], start=1)
+        ])
+        select.callback = self.open(select, page)
+        self.add_item(select)
+
+    def add_page_buttons(self, page, pages):
+        previous_button = discord.ui.Button(label="Previous", style=discord.ButtonStyle.secondary, disabled=page == 0)
+        previous_button.callback = self.turn(page - 1)
+        self.add_item(previous_button)
+        position = discord.ui.Button(label=f"{page + 1}/{pages}", style=discord.ButtonStyle.secondary, disabled=True)
+        self.add_item(position)
+        next_button = discord.ui.Button(label="Next", style=discord.ButtonStyle.secondary, disabled=page == pages - 1)
+        next_button.callback = self.turn(page + 1)
+        self.add_item(next_button)
+
+    def turn(self, page):
+        async def callback(interaction: discord.Interaction):
+            result_set = await self.stored(interaction)
+            if result_set is not None:
+                payload = await defer_if_slow(interaction, prepare_result_page(result_set, page))
+                await send_payload(interaction, serialized(payload), self.key)
+
+        return callback
+
+    def open(self, select, page):
+        async def callback(interaction: discord.Interaction):
+            result_set = await self.stored(interaction)
+            if result_set is not None:
+                category, row, _ = result_set.items[int(select.values[0])]
+                payload = await defer_if_slow(interaction, prepare_detail(category, row, result_set.render_profile))
+                await send_payload(interaction, serialized(payload._replace(results=result_set, page=page)), self.key)
+
+        return callback
+
+    async def stored(self, interaction):
+        result_set = result_pages.get(self.key)
+        if result_set is None:
             embed = discord.Embed(
-                title="Multiple Bosses Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
+                title="Results Expired",
+                description="These results are no longer available. Please search again.",
+                colour=0xbea56f
             )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        return result_set
 
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"HP: {row['HP']} | Location(s): {row['Locations & Drops']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            hp = row['HP']
-            locations_and_drops = ast.literal_eval(row['Locations & Drops']) if pd.notna(
-                row['Locations & Drops']) else {}
-            blockquote = row['blockquote'] if pd.notna(row['blockquote']) else "No quotes available."
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/bosses/{image_filename}'
 
-            file = discord.File(local_image_path, filename=image_filename)
+class SuggestionView(discord.ui.View):
+    def __init__(self, command, suggestions, display=None):
+        super().__init__(timeout=180)
+        for suggestion in suggestions:
+            button = discord.ui.Button(label=suggestion[:80], style=discord.ButtonStyle.secondary)
+            button.callback = self.rerun(command, suggestion, display)
+            self.add_item(button)
 
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
+    @staticmethod
+    def rerun(command, suggestion, display):
+        async def callback(interaction: discord.Interaction):
+            await command.callback(interaction, suggestion, display)
 
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=f"**HP**: {hp}",
-                inline=False
-            )
+        return callback
 
-            if locations_and_drops:
-                for location, drops in locations_and_drops.items():
-                    embed.add_field(
-                        name=f"**Location**: {location}",
-                        value=f"**Drops**: {', '.join(drops)}",
-                        inline=False
-                    )
-
-            embed.add_field(
-                name="**Quote**",
-                value=blockquote,
-                inline=False
-            )
 
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
+async def prepare_no_results(embed, index, search_value, command, render_profile):
+    suggestions = await workers.run(index.suggest, search_value)
+    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
 
-            await interaction.response.send_message(file=file, embed=embed)
-    else:
-        embed = discord.Embed(
-            title="No Bosses Found",
-            description=f"No bosses found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
+    if suggestions:
+        embed.add_field(
+            name="Did you mean",
+            value="\n".join(f"• {suggestion}" for suggestion in suggestions),
+            inline=False
         )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="incantation", description="Search for an incantation")
-@validate_item_name(min_length=3)
-async def incantation(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(incantation_df, item_name)
+        return Payload(embed, suggestions=suggestions, command=command, display=render_profile)
+    embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
+    return Payload(embed)
 
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Incantations Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
 
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | FP: {row['FP']}",
-                    inline=False
-                )
-                fields_count += 1
+def category_index(category):
+    return boss_indexes.get(category.key, name_indexes[category.key])
 
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
 
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            effect = row['effect']
-            fp = row['FP']
-            slot = row['slot']
-            int_stat = row['INT']
-            fai_stat = row['FAI']
-            arc_stat = row['ARC']
-            stamina_cost = row['stamina cost']
-            bonus = row['bonus']
-            group = row['group']
-            location = row['location']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/incantations/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**FP**: {fp}\n"
-                    f"**Slot**: {slot}\n"
-                    f"**INT**: {int_stat}\n"
-                    f"**FAI**: {fai_stat}\n"
-                    f"**ARC**: {arc_stat}\n"
-                    f"**Stamina Cost**: {stamina_cost}\n"
-                    f"**Bonus**: {bonus}\n"
-                    f"**Group**: {group}\n"
-                    f"**Location**: {location}"
-                ),
-                inline=False
-            )
+def search_category(category, search_value):
+    if category.search_column == "name":
+        return search_item_in_df(category.key, search_value)
+    return category_index(category).search(search_value, exact=category.exact_match)
 
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
 
-            embed.set_image(url=f"attachment://{image_filename}")
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
+async def prepare_category_results(category, item_name, command, render_profile):
+    results = await workers.run(search_category, category, item_name)
 
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
+    if not results:
         embed = discord.Embed(
-            title="No Incantations Found",
-            description=f"No incantations found for '**{item_name}**'. Please try again with a different search term.",
+            title=f"No {category.title} Found",
+            description=(
+                f"No {category.noun} found for {category.query_label}'**{item_name}**'. "
+                f"Please try again with a different search term."
+            ),
             colour=0xbea56f,
             timestamp=datetime.now()
         )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="shield", description="Search for a shield")
-@validate_item_name(min_length=3)
-async def shield(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(shields_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Shields Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Weight: {row['weight']} | Damage Type: {row['damage type']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
+        return await prepare_no_results(embed, category_index(category), item_name, command, render_profile)
 
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            weight = row['weight']
-            description = row['description']
-            dlc = row['dlc']
-            damage_type = row['damage type']
-            category = row['category']
-            passive_effect = row['passive effect']
-            skill = row['skill']
-            fp_cost = row['FP cost']
-
-            try:
-                requirements = ast.literal_eval(row['requirements'])
-                if isinstance(requirements, list):
-                    requirements_str = "\n".join(
-                        [f"**{key}**: {value}" for req in requirements for key, value in req.items()])
-                else:
-                    requirements_str = "No specific requirements."
-            except (ValueError, SyntaxError):
-                requirements_str = "No specific requirements."
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/shields/{image_filename}'
-
-            file = discord.File(local_image_path, filename=image_filename)
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Weight**: {weight}\n"
-                    f"**Damage Type**: {damage_type}\n"
-                    f"**Category**: {category}\n"
-                    f"**Passive Effect**: {passive_effect}\n"
-                    f"**Skill**: {skill}\n"
-                    f"**FP Cost**: {fp_cost}\n"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="**Requirements**",
-                value=requirements_str,
-                inline=True
-            )
-
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
-
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
+    if len(results) > 1:
         embed = discord.Embed(
-            title="No Shields Found",
-            description=f"No shields found for '**{item_name}**'. Please try again with a different search term.",
+            title=f"Multiple {category.title} Found",
+            description=(
+                f"Your search for '**{item_name}**' returned **{len(results)}** results. "
+                f"Please refine your search using a more specific name if needed."
+            ),
             colour=0xbea56f,
             timestamp=datetime.now()
         )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
         embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="skill", description="Search for a skill")
-@validate_item_name(min_length=3)
-async def skill(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(skills_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Skills Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Equipment: {row['equipament']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
+        items = [(category, row, category.summary_field(row)) for row in results]
+        return await prepare_result_page(ResultSet(embed.to_dict(), items, render_profile), 0)
+
+    return await prepare_detail(category, results[0], render_profile)
+
+
+async def prepare_detail(category, row, render_profile):
+    # The embed was rendered when the snapshot was built; only the branding and image are added here.
+    response = response_bundle.get(row)
+    embed = {**response.embed, **EMBED_BRANDING}
+    if render_profile == "text":
+        return Payload(embed)
+
+    # The thumbnail profile sends the smallest, pre-shrunk variant in the embed's thumbnail slot.
+    thumbnail = render_profile == "thumbnail"
+    entry = response.image
+    image = None
+    if entry is not None:
+        local_image_path = image_variants.pick(entry.path, "thumbnail" if thumbnail else IMAGE_PROFILE)
+        image = await image_cache.get(local_image_path)
+
+    if image is None:
+        if response.fallback_url is not None:
+            embed["thumbnail" if thumbnail else "image"] = {"url": response.fallback_url}
+        return Payload(embed)
+
+    # Store files are named by content hash; attach them under the source image's name instead.
+    image_filename = os.path.splitext(os.path.basename(entry.path))[0] + os.path.splitext(local_image_path)[1]
+    return Payload(embed, local_image_path, image_filename, image.digest, thumbnail)
+
+
+async def prepare_result_page(result_set, page):
+    """One page of a multi-result response, with the ResultSet behind its paginated view."""
+    embed = discord.Embed.from_dict(result_set.embed)
+    items = result_set.items[page * MAX_FIELDS_PER_EMBED:(page + 1) * MAX_FIELDS_PER_EMBED]
+    for _, _, (name, value, inline) in items:
+        embed.add_field(name=name, value=value, inline=inline)
+    listed = [(category, row) for category, row, _ in items]
+    payload = await prepare_multiple_results(embed, listed, result_set.render_profile)
+    return payload._replace(results=result_set, page=page)
+
+
+async def prepare_multiple_results(embed, listed, render_profile):
+    """A multi-result embed with a sheet of the listed (category, row) thumbnails, numbered like its fields."""
+    entries = [image_manifest.get(category.key, row['image']) for category, row in listed]
+    if render_profile == "text" or not any(entries):
+        return Payload(embed)
+
+    for number, field in enumerate(embed.fields, start=1):
+        embed.set_field_at(number - 1, name=f"{number}. {field.name}", value=field.value, inline=field.inline)
+    key = sheet_key([entry and entry.digest for entry in entries])
+    paths = [entry and image_variants.pick(entry.path, "thumbnail") for entry in entries]
+    path = sheet_path(key)
+    return await prepare_rendered(embed, key, path, render_sheet, (paths, path), "results.png")
+
+
+async def prepare_rendered(embed, key, path, render, args, image_filename):
+    """The image render(*args) writes to path, drawn only when neither the CDN cache nor the disk has it."""
+    if attachment_cache.get(key) is None and await image_cache.get(path) is None:
+        await workers.run(render, *args, heavy=True)
+    return Payload(embed, path, image_filename, key)
+
+
+def quote_spellings(embed, spellings):
+    """The embed dict with the normalized queries its description quotes replaced by the user's spellings."""
+    description = embed.get("description")
+    if not description or not spellings:
+        return embed
+    for spelling in spellings:
+        description = description.replace(f"'**{normalize_name(spelling)}**'", f"'**{spelling}**'")
+    return {**embed, "description": description}
+
+
+async def send_payload(interaction, payload, pages_key=None, spellings=()):
+    """Send a prepared Payload, reusing the CDN URL of an earlier upload of its image, uploading it only on a miss.
+
+    Multiple results get a ResultsView over the ResultSet, stored under the searching interaction's ID. Its page
+    turns and opened items pass that key and edit the message the view belongs to.
+
+    Payloads are shared by every spelling of a query and quote its normalized form; spellings, the queries as this
+    user typed them, are quoted instead.
+    """
+    # Payloads are shared and cached, so each send builds its own embed, stamped with the time it is sent.
+    embed = discord.Embed.from_dict(quote_spellings(payload.embed, spellings))
+    if embed.timestamp is not None:
+        embed.timestamp = datetime.now()
+    kwargs = {"embed": embed}
+    if payload.suggestions:
+        kwargs["view"] = SuggestionView(payload.command, payload.suggestions, payload.display)
+    if payload.results is not None:
+        key = pages_key or interaction.id
+        # Page turns rebuild the embed from the stored set, so it keeps this user's spelling too.
+        results = payload.results._replace(embed=quote_spellings(payload.results.embed, spellings))
+        result_pages.put(key, results)
+        kwargs["view"] = ResultsView(key, results, payload.page)
+    edit = pages_key is not None
+    if payload.image_path is None:
+        await respond(interaction, edit, **kwargs)
+        return
+
+    set_image = embed.set_thumbnail if payload.thumbnail else embed.set_image
+    cached_url = attachment_cache.get(payload.image_key)
+    if cached_url is not None:
+        set_image(url=cached_url)
+        await respond(interaction, edit, **kwargs)
+        return
+
+    image = await image_cache.get(payload.image_path)
+    if image is None:
+        await respond(interaction, edit, **kwargs)
+        return
+
+    file = discord.File(io.BytesIO(image.data), filename=payload.image_filename)
+    set_image(url=f"attachment://{payload.image_filename}")
+    await respond(interaction, edit, file=file, **kwargs)
 
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            skill_type = row['type']
-            equipment = row['equipament']
-            charge = row['charge']
-            fp = row['FP']
-            effect = row['effect']
-            locations = row['locations']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url) if pd.notna(image_url) and image_url != "No Image" else None
-            local_image_path = f'images/skills/{image_filename}' if image_filename else None
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Type**: {skill_type}\n"
-                    f"**Equipment**: {equipment}\n"
-                    f"**Charge**: {charge}\n"
-                    f"**FP**: {fp}\n"
-                    f"**Effect**: {effect}\n"
-                    f"**Locations**: {locations}\n"
-                ),
-                inline=False
-            )
-
-            if local_image_path and os.path.exists(local_image_path):
-                file = discord.File(local_image_path, filename=image_filename)
-                embed.set_image(url=f"attachment://{image_filename}")
-                embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                await interaction.response.send_message(embed=embed, file=file)
-            else:
-                embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                await interaction.response.send_message(embed=embed)
-    else:
-        embed = discord.Embed(
-            title="No Skills Found",
-            description=f"No skills found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
+    try:
+        message = await interaction.original_response()
+    except discord.HTTPException:
+        return
+    if message.attachments:
+        url = message.attachments[0].url
+        attachment_cache.put(payload.image_key, url)
+        await workers.run(attachment_cache.save, payload.image_key, url)
+
+
+def category_command(category):
+    @bot.tree.command(name=category.command, description=category.description)
+    @validate_item_name(min_length=3)
+    @scheduler.schedule(category.command)
+    async def command(interaction: discord.Interaction, item_name: str, display: Optional[RenderProfile] = None):
+        render_profile = display or guild_settings.render_profile(interaction.guild_id)
+        # Every spelling of a query shares its response, so it is prepared from the normalized form.
+        query = normalize_name(item_name)
+        await answer(
+            interaction, (category.command, query, render_profile),
+            lambda: prepare_category_results(category, query, command, render_profile),
+            (item_name,)
         )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
 
+    return command
 
-@bot.tree.command(name="sorcery", description="Search for sorcery")
-@validate_item_name(min_length=3)
-async def sorcery(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(sorceries_df, item_name)
 
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Sorceries Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
+def name_autocomplete(index):
+    async def autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return [app_commands.Choice(name=name[:100], value=name[:100]) for name in index.complete(current)]
 
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | FP Cost: {row['FP']}",
-                    inline=False
-                )
-                fields_count += 1
+    return autocomplete
 
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
 
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            effect = row['effect']
-            fp = row['FP']
-            slot = row['slot']
-            intelligence = row['INT']
-            faith = row['FAI']
-            arcane = row['ARC']
-            stamina_cost = row['stamina cost']
-            bonus = row['bonus']
-            location = row['location']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url) if pd.notna(image_url) and image_url != "No Image" else None
-            local_image_path = f'images/sorceries/{image_filename}' if image_filename else None
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**FP**: {fp}\n"
-                    f"**Slot**: {slot}\n"
-                    f"**INT**: {intelligence} | **FAI**: {faith} | **ARC**: {arcane}\n"
-                    f"**Stamina Cost**: {stamina_cost}\n"
-                    f"**Bonus**: {bonus}\n"
-                    f"**Location**: {location}\n"
-                ),
-                inline=False
-            )
+category_commands = {category.key: category_command(category) for category in categories}
 
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
+command_indexes = {
+    command: boss_indexes.get(category, name_indexes[category]) for category, command in category_commands.items()
+}
 
-            if local_image_path and os.path.exists(local_image_path):
-                file = discord.File(local_image_path, filename=image_filename)
-                embed.set_image(url=f"attachment://{image_filename}")
-                embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                await interaction.response.send_message(embed=embed, file=file)
-            else:
-                embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                await interaction.response.send_message(embed=embed)
-    else:
-        embed = discord.Embed(
-            title="No Sorceries Found",
-            description=f"No sorceries found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
+for command, index in command_indexes.items():
+    command.autocomplete("item_name")(name_autocomplete(index))
 
 
-@bot.tree.command(name="spirit", description="Search for spirit")
+@bot.tree.command(name="search", description="Search every category at once")
 @validate_item_name(min_length=3)
-async def spirit(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(spirit_ashes_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Spirit Ashes Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"FP Cost: {row['FP cost']} | HP Cost: {row['HP cost']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
+@scheduler.schedule("search")
+async def search(interaction: discord.Interaction, item_name: str, display: Optional[RenderProfile] = None):
+    render_profile = display or guild_settings.render_profile(interaction.guild_id)
+    query = normalize_name(item_name)
+    await answer(
+        interaction, ("search", query, render_profile),
+        lambda: prepare_search_results(query, render_profile),
+        (item_name,)
+    )
+
+
+async def prepare_search_results(item_name, render_profile):
+    hits = await workers.run(search_all_categories, item_name)
+
+    if hits:
+        if len(hits) == 1 or (hits[0].quality == EXACT and hits[1].quality != EXACT):
+            hit = hits[0]
+            category, row = categories_by_key[hit.category], tables[hit.category][hit.position]
+            # Opens the hit's own row; searching again by its name misses rows a command finds by another column.
+            return await prepare_once(
+                ("detail", (hit.category, hit.position), render_profile),
+                lambda: prepare_detail(category, row, render_profile)
+            )
+
+        if hits[0].quality == CORRECTED:
+            description = f"No exact matches for '**{item_name}**'. Closest matches:"
         else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            type_ = row['type']
-            fp_cost = row['FP cost']
-            hp_cost = row['HP cost']
-            effect = row['effect']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/spiritAshes/{image_filename}'
-
-            file = discord.File(local_image_path, filename=image_filename)
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Type**: {type_}\n"
-                    f"**FP Cost**: {fp_cost}\n"
-                    f"**HP Cost**: {hp_cost}\n"
-                    f"**Effect**: {effect}\n"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
+            description = (
+                f"Your search for '**{item_name}**' returned **{len(hits)}** results across "
+                f"**{len({hit.category for hit in hits})}** categories. "
+                f"Please refine your search or use the listed command."
             )
 
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
         embed = discord.Embed(
-            title="No Spirit Ashes Found",
-            description=f"No Spirit Ashes found for '**{item_name}**'. Please try again with a different search term.",
+            title="Multiple Items Found",
+            description=description,
             colour=0xbea56f,
             timestamp=datetime.now()
         )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="talisman", description="Search for a talisman")
-@validate_item_name(min_length=3)
-async def talisman(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(talisman_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Talismans Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | Weight: {row['weight']} | Value: {row['value']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            effect = row['effect']
-            weight = row['weight']
-            value = row['value']
-            description = row['description']
-            image_url = row['image']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/talismans/{image_filename}'
-
-            file = discord.File(local_image_path, filename=image_filename)
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**Weight**: {weight}\n"
-                    f"**Value**: {value}\n"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
 
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Talismans Found",
-            description=f"No talismans found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
         embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="weapon", description="Search for a Weapon")
-@validate_item_name(min_length=3)
-async def weapon(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(weapon_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
+        items = [
+            (
+                categories_by_key[hit.category],
+                tables[hit.category][hit.position],
+                (hit.name, f"Command: /{category_commands[hit.category].name}", False)
+            )
+            for hit in hits
+        ]
+        return await prepare_result_page(ResultSet(embed.to_dict(), items, render_profile), 0)
+
+    embed = discord.Embed(
+        title="No Items Found",
+        description=f"No items found for '**{item_name}**'. Please try again with a different search term.",
+        colour=0xbea56f,
+        timestamp=datetime.now()
+    )
+    return await prepare_no_results(embed, global_index, item_name, search, render_profile)
+
+
+search.autocomplete("item_name")(name_autocomplete(global_index))
+
+
+compare_categories = {category.command: category for category in categories if category.compare}
+
+
+@bot.tree.command(name="compare", description="Compare two items side by side")
+@app_commands.describe(kind="What kind of items to compare", first="The first item", second="The second item")
+@app_commands.choices(kind=[
+    app_commands.Choice(name=command.capitalize(), value=command) for command in compare_categories
+])
+@scheduler.schedule("compare")
+async def compare(interaction: discord.Interaction, kind: str, first: str, second: str):
+    queries = normalize_name(first), normalize_name(second)
+    await answer(
+        interaction, ("compare", (kind, *queries), None),
+        lambda: prepare_comparison(compare_categories[kind], *queries),
+        (first, second)
+    )
+
+
+async def prepare_comparison(category, first, second):
+    rows = []
+    for item_name in (first, second):
+        results = await workers.run(search_category, category, item_name)
+        names = list(dict.fromkeys(row['name'] for row in results))
+        if len(names) != 1:
             embed = discord.Embed(
-                title="Multiple Weapons Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
+                title="Item Not Found",
+                description=f"Could not find a single {category.command} matching '**{item_name}**'.",
                 colour=0xbea56f,
                 timestamp=datetime.now()
             )
-
-            fields_count = 0
-            for index, row in results.iterrows():
+            suggestions = names[:5] or await workers.run(category_index(category).suggest, item_name)
+            if suggestions:
                 embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Weight: {row['weight']} | Damage Type: {row['damage type']}",
+                    name="Did you mean",
+                    value="\n".join(f"• {suggestion}" for suggestion in suggestions),
                     inline=False
                 )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            weight = row['weight']
-            description = row['description']
-            dlc = row['dlc']
-
-            try:
-                requirements = ast.literal_eval(row['requirements'])
-                if isinstance(requirements, dict):
-                    requirements = [requirements]
-            except:
-                requirements = [{"Requirement": row['requirements']}]
-
-            damage_type = row['damage type']
-            category = row['category']
-            passive_effect = row['passive effect']
-            skill = row['skill']
-            fp_cost = row['FP cost']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-            image_filename = os.path.basename(image_url)
-            local_image_path = f'images/weapons/{image_filename}'
-
-            file = discord.File(local_image_path, filename=image_filename)
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"**Name**: {name} {dlc_label}\n",
-                value=(
-                    f"**Weight**: {weight}\n"
-                    f"**Damage Type**: {damage_type}\n"
-                    f"**Category**: {category}\n"
-                    f"**Passive Effect**: {passive_effect}\n"
-                    f"**Skill**: {skill}\n"
-                    f"**FP Cost**: {fp_cost}\n"
-                ),
-                inline=False
-            )
-
-            requirements_str = "\n".join([f"**{key}**: {value}" for req in requirements for key, value in req.items()])
-            embed.add_field(
-                name="**Requirements**",
-                value=requirements_str,
-                inline=True
-            )
-
-            embed.add_field(
-                name="**Description**",
-                value=description,
-                inline=False
-            )
-
-            embed.set_image(url=f"attachment://{image_filename}")
             embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Weapons Found",
-            description=f"No weapons found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-def search_remembrance(boss_name):
-    try:
-        results = remembrances_df[remembrances_df['boss'].str.contains(boss_name, case=False, na=False)]
-        return results
-    except Exception as e:
-        print(f"Error during search: {e}")
-        return pd.DataFrame()
-
-
-@bot.tree.command(name="remembrance", description="Search for a remembrance by boss name")
-@validate_item_name(min_length=3)
-async def remembrance(interaction: discord.Interaction, boss_name: str):
-    results = search_remembrance(boss_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Remembrances Found",
-                description=(
-                    f"Your search for '**{boss_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['boss']}",
-                    value=f"Type: {row['type']} | Value: {row['value']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            option_1 = row['option 1']
-            option_2 = row['option 2']
-            value = row['value']
-            dlc = row['dlc']
-            boss = row['boss']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/remembrances/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Type**: {row['type']}\n"
-                    f"**Boss**: {boss}\n"
-                    f"**Value**: {value}\n"
-                    f"**Option 1**: {option_1}\n"
-                    f"**Option 2**: {option_2}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Remembrances Found",
-            description=f"No remembrances found for boss '**{boss_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="consumable", description="Search for consumables")
-@validate_item_name(min_length=3)
-async def consumable(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(consumables_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Consumables Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | FP Cost: {row['FP cost']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            fp_cost = row['FP cost']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else "(Base Game)"
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/consumables/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**FP Cost**: {fp_cost}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Consumables Found",
-            description=f"No consumables found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="tear", description="Search for a Crystal Tear")
-@validate_item_name(min_length=3)
-async def tear(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(crystalTears_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Crystal Tears Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | FP Cost: {row['FP cost']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            fp_cost = row['FP cost']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/crystalTears/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**FP Cost**: {fp_cost}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Crystal Tears Found",
-            description=f"No crystal tears found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-def search_great_rune(search_value):
-    try:
-        exact_match = greatRunes_df[greatRunes_df['boss'].str.lower() == search_value.lower()]
-
-        if not exact_match.empty:
-            return exact_match
-
-        results = greatRunes_df[greatRunes_df['boss'].str.contains(search_value, case=False, na=False)]
-        return results
-    except re.error as e:
-        print(f"Regex error: {e}")
-        return pd.DataFrame()
-
-
-@bot.tree.command(name="greatrune", description="Search for a Great Rune by boss name")
-@validate_item_name(min_length=3)
-async def greatrune(interaction: discord.Interaction, boss_name: str):
-    results = search_great_rune(boss_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Great Runes Found",
-                description=(
-                    f"Your search for '**{boss_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Effect: {row['effect']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            description = row['description']
-            location = row['location']
-            divine_tower = row['divine tower locations']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/greatRunes/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Type**: {row['type']}\n"
-                    f"**Effect**: {effect}\n"
-                    f"**Location**: {location}\n"
-                    f"**Divine Tower Location**: {divine_tower}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Great Runes Found",
-            description=f"No great runes found for '**{boss_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="cookbook", description="Search for a Cookbook")
-@validate_item_name(min_length=3)
-async def cookbook(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(cookbooks_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Cookbooks Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | Required For: {row['required for']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            required_for = row['required for']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/cookbooks/{image_filename}'
-
-            required_for_str = ', '.join(ast.literal_eval(required_for))
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**Required For**: {required_for_str}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Cookbooks Found",
-            description=f"No cookbooks found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="keyitem", description="Search for a key item by name")
-@validate_item_name(min_length=3)
-async def keyitem(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(keyitems_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Key Items Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Usage: {row['usage']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            item_type = row['type']
-            usage = row['usage']
-            location = row['location']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/keyitems/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Type**: {item_type}\n"
-                    f"**Usage**: {usage}\n"
-                    f"**Location**: {location}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Key Items Found",
-            description=f"No key items found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="material", description="Search for a material by name")
-@validate_item_name(min_length=3)
-async def material(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(materials_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Materials Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/materials/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Materials Found",
-            description=f"No materials found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="multi", description="Search for a multiplayer item by name")
-@validate_item_name(min_length=3)
-async def multi(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(multi_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Items Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Effect: {row['effect']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            item_type = row['type']
-            effect = row['effect']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/multi/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Type**: {item_type}\n"
-                    f"**Effect**: {effect}\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Items Found",
-            description=f"No multiplayer items found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="tool", description="Search for a tool by name")
-@validate_item_name(min_length=3)
-async def tool(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(tools_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Tools Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Type: {row['type']} | Usage: {row['usage']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            tool_type = row['type']
-            usage = row['usage']
-            location = row['location']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/tools/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Type**: {tool_type}\n"
-                    f"**Usage**: {usage}\n"
-                    f"**Location**: {location}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Tools Found",
-            description=f"No tools found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="upgradematerial", description="Search for an upgrade material by name")
-@validate_item_name(min_length=3)
-async def upgradematerial(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(upgradeMaterials_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Upgrade Materials Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            effect = row['effect']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/upgradeMaterials/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Upgrade Materials Found",
-            description=f"No upgrade materials found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="whetblade", description="Search for a whetblade by name")
-@validate_item_name(min_length=3)
-async def whetblade(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(whetblades_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Whetblades Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Usage: {row['usage']} | Location: {row['location']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            description = row['description']
-            usage = row['usage']
-            location = row['location']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/whetblades/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Usage**: {usage}\n"
-                    f"**Location**: {location}\n\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Whetblades Found",
-            description=f"No whetblades found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-@bot.tree.command(name="bell", description="Search for a bell bearing by name")
-@validate_item_name(min_length=3)
-async def bell(interaction: discord.Interaction, item_name: str):
-    results = search_item_in_df(bells_df, item_name)
-
-    if not results.empty:
-        if len(results) > 1:
-            embed = discord.Embed(
-                title="Multiple Bell Bearings Found",
-                description=(
-                    f"Your search for '**{item_name}**' returned **{len(results)}** results. "
-                    f"Please refine your search using a more specific name if needed."
-                ),
-                colour=0xbea56f,
-                timestamp=datetime.now()
-            )
-
-            fields_count = 0
-            for index, row in results.iterrows():
-                embed.add_field(
-                    name=f"{row['name']}",
-                    value=f"Effect: {row['effect']} | Type: {row['type']}",
-                    inline=False
-                )
-                fields_count += 1
-
-                if fields_count >= MAX_FIELDS_PER_EMBED:
-                    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-                    await interaction.response.send_message(embed=embed)
-                    return
-
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-            await interaction.response.send_message(embed=embed)
-        else:
-            row = results.iloc[0]
-
-            name = row['name']
-            image_url = row['image']
-            effect = row['effect']
-            description = row['description']
-            dlc = row['dlc']
-
-            dlc_label = "(DLC)" if dlc == 1 else ""
-
-            image_filename = os.path.basename(image_url)
-
-            local_image_path = f'images/bells/{image_filename}'
-
-            embed = discord.Embed(colour=0xbea56f, timestamp=datetime.now())
-            embed.set_author(name=AUTHOR_NAME, icon_url=ICON_URL)
-
-            embed.add_field(
-                name=f"{name} {dlc_label}",
-                value=(
-                    f"**Effect**: {effect}\n"
-                    f"**Description**: {description}"
-                ),
-                inline=True
-            )
-
-            file = discord.File(local_image_path, filename=image_filename)
-            embed.set_image(url=f"attachment://{image_filename}")
-            embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-
-            await interaction.response.send_message(embed=embed, file=file)
-    else:
-        embed = discord.Embed(
-            title="No Bell Bearings Found",
-            description=f"No bell bearings found for '**{item_name}**'. Please try again with a different search term.",
-            colour=0xbea56f,
-            timestamp=datetime.now()
-        )
-        embed.set_image(url=NO_ITEMS_FOUND_IMAGE)
-        embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
-        await interaction.response.send_message(embed=embed)
-
-
-bot.run(DISCORD_BOT_TOKEN)
+            return Payload(embed)
+        rows.append(results[0])
+
+    embed = discord.Embed(
+        title=f"{rows[0]['name']} vs {rows[1]['name']}",
+        colour=0xbea56f,
+        timestamp=datetime.now()
+    )
+    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
+
+    # The card's key covers the rows and the data version, so a known card needs neither drawing nor uploading.
+    key = card_key(category, rows, state["version"])
+    columns = []
+    for row in rows:
+        entry = image_manifest.get(category.key, row['image'])
+        columns.append((row['name'], entry and entry.path, category.compare_fields(row)))
+    path = card_path(key)
+    return await prepare_rendered(embed, key, path, render_card, (columns, path), "comparison.png")
+
+
+async def compare_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    category = compare_categories.get(interaction.namespace.kind)
+    if category is None:
+        return []
+    return [
+        app_commands.Choice(name=name[:100], value=name[:100]) for name in category_index(category).complete(current)
+    ]
+
+
+compare.autocomplete("first")(compare_autocomplete)
+compare.autocomplete("second")(compare_autocomplete)
+
+
+@bot.tree.command(name="display", description="Choose how item results are shown in this server")
+@app_commands.guild_only()
+@app_commands.default_permissions(manage_guild=True)
+@app_commands.describe(profile="Full image, a thumbnail, or text only")
+async def set_display(interaction: discord.Interaction, profile: RenderProfile):
+    guild_settings.set_render_profile(interaction.guild_id, profile)
+    await workers.run(guild_settings.save, interaction.guild_id, profile)
+    embed = discord.Embed(
+        title="Display Updated",
+        description=f"Item results in this server now use the **{profile}** display.",
+        colour=0xbea56f,
+        timestamp=datetime.now()
+    )
+    embed.set_footer(text=FOOTER_TEXT, icon_url=ICON_URL)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+if __name__ == "__main__":
+    bot.run(DISCORD_BOT_TOKEN)
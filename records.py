@@ -0,0 +1,121 @@
+import csv
+import re
+import sys
+
+from data import csv_files, literal_columns, parse_literal_column, reference_csv_files, report_problems
+
+# The strings pandas.read_csv treats as missing by default, so both loaders agree on what is empty.
+MISSING_VALUES = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+_INTEGER = re.compile(r"[+-]?\d+")
+_FLOAT = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+INTERN_MAX_LENGTH = 64
+
+
+def infer_column(raw_values):
+    """Convert one CSV column the way pandas would: all-integer, else all-numeric, else text."""
+    present = [value for value in raw_values if value not in MISSING_VALUES]
+    if present and all(_INTEGER.fullmatch(value) for value in present):
+        convert = int if len(present) == len(raw_values) else float
+    elif present and all(_FLOAT.fullmatch(value) for value in present):
+        convert = float
+    else:
+        convert = None
+
+    values = []
+    for value in raw_values:
+        if value in MISSING_VALUES:
+            values.append(None)
+        elif convert is not None:
+            values.append(convert(value))
+        elif len(value) <= INTERN_MAX_LENGTH:
+            values.append(sys.intern(value))
+        else:
+            values.append(value)
+    return values
+
+
+class Record:
+    """One CSV row; values are read by column name like a pandas row."""
+
+    __slots__ = ("positions", "values")
+
+    def __init__(self, positions, values):
+        self.positions = positions
+        self.values = values
+
+    def __getitem__(self, column):
+        return self.values[self.positions[column]]
+
+    def get(self, column, default=None):
+        position = self.positions.get(column)
+        return default if position is None else self.values[position]
+
+    def to_dict(self):
+        return dict(zip(self.positions, self.values))
+
+
+class Table:
+    """Column-typed rows of one category CSV, held as tuples behind Record views."""
+
+    __slots__ = ("name", "columns", "positions", "rows")
+
+    def __init__(self, name, columns, column_values):
+        self.name = name
+        self.columns = [sys.intern(column) for column in columns]
+        self.positions = {column: position for position, column in enumerate(self.columns)}
+        self.rows = [Record(self.positions, values) for values in zip(*column_values)]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, position):
+        return self.rows[position]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def column(self, column):
+        position = self.positions[column]
+        return [row.values[position] for row in self.rows]
+
+
+def read_table(category, path):
+    with open(path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        columns = next(reader)
+        raw_rows = list(reader)
+
+    column_values = [infer_column([row[position] for row in raw_rows]) for position in range(len(columns))]
+
+    problems = []
+    names = column_values[columns.index('name')]
+    for column in literal_columns.get(category, {}):
+        position = columns.index(column)
+        column_values[position], column_problems = parse_literal_column(category, column, names, column_values[position])
+        problems += column_problems
+
+    return Table(category, columns, column_values), problems
+
+
+def read_tables(files):
+    tables = {}
+    problems = []
+    for category, path in files.items():
+        tables[category], table_problems = read_table(category, path)
+        problems += table_problems
+
+    report_problems(problems)
+    return tables
+
+
+def load_tables():
+    return read_tables(csv_files)
+
+
+def load_reference_tables():
+    return read_tables(reference_csv_files)
@@ -0,0 +1,47 @@
+"""Every single-result embed the bot can send, rendered ahead of time when the data snapshot is built.
+
+The data only changes between releases, so each row's detail embed is built once, as the
+dict discord.Embed.to_dict() would produce, and stored with a reference to its image. The
+timestamp and the bot's branding (author and footer) are left out and patched in per
+response, so a detail lookup at runtime is an index hit plus a dict merge.
+
+Entries are keyed by the table's Record objects themselves, which hash by identity: the
+snapshot pickles them once for the tables and the bundle, so any row a search returns is
+a key, without storing row positions anywhere.
+"""
+from collections import namedtuple
+
+EMBED_COLOUR = 0xbea56f
+
+# image: the row's ImageEntry, or None. fallback_url: the CSV's image URL, linked when the local file is missing.
+BundledResponse = namedtuple("BundledResponse", "embed image fallback_url")
+
+
+def render_embed(category, row):
+    return {
+        "type": "rich",
+        "color": EMBED_COLOUR,
+        "fields": [
+            {"name": name, "value": value, "inline": inline} for name, value, inline in category.detail_fields(row)
+        ],
+    }
+
+
+class ResponseBundle:
+    def __init__(self, tables, categories, manifest):
+        self.responses = {}
+        for category in categories:
+            category.compile(tables[category.key].columns)
+            for row in tables[category.key]:
+                # Rows whose file is missing link the CSV's image URL, unless the category's images are optional.
+                fallback_url = None
+                if not category.optional_image and category.image(row) is not None:
+                    fallback_url = row['image']
+                image = manifest.get(category.key, row['image'])
+                self.responses[row] = BundledResponse(render_embed(category, row), image, fallback_url)
+
+    def get(self, row):
+        return self.responses[row]
+
+    def __len__(self):
+        return len(self.responses)
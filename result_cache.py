@@ -0,0 +1,69 @@
+"""Bounded LRU of prepared responses, keyed by data version, command, normalized query and render profile.
+
+Popular queries are answered from memory instead of being searched and built again. The
+cache holds serialized payloads and evicts the least recently used once either its entry or
+its byte limit is exceeded. Each entry remembers how long it took to prepare, so hits
+report the latency they saved.
+
+Nothing is ever invalidated: keys start with the version of the data snapshot they were
+prepared from, and the data only changes when the bot restarts with a new snapshot, which
+starts with an empty cache.
+"""
+import json
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 16 * 2 ** 20
+
+
+def payload_size(payload):
+    """Approximate bytes a serialized payload holds: its JSON, counting every field."""
+    return len(json.dumps(payload, default=str).encode())
+
+
+class ResultCache:
+    def __init__(self, version, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.version = version
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        payload, _, seconds = entry
+        self.saved_seconds += seconds
+        return payload
+
+    def put(self, key, payload, seconds):
+        """Keep payload, which took seconds to prepare, unless it alone exceeds the byte limit."""
+        size = payload_size(payload)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self.entries[key] = (payload, size, seconds)
+        self.size += size
+
+        while self.size > self.max_bytes or len(self.entries) > self.max_entries:
+            _, (_, evicted_size, _) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups if lookups else 0.0
+        return (f"result cache: {len(self.entries)} entries, {self.size / 2 ** 20:.1f} MB, "
+                f"{self.hits} hits / {self.misses} misses ({ratio:.0%}), {self.evictions} evictions, "
+                f"{self.saved_seconds * 1e3:.0f} ms of preparation saved")
@@ -0,0 +1,42 @@
+"""Resolved multi-result sets kept for their paginated views, keyed by the interaction that searched.
+
+Page turns and item selections are answered from the stored set instead of searching again.
+Sets expire after a TTL, matching the views' timeout, and the oldest are dropped beyond
+max_entries so a burst of searches cannot grow the store without bound.
+"""
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 15 * 60
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ResultPages:
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        """The stored result set, or None once it expired or was dropped."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires, result_set = entry
+        if expires < time.monotonic():
+            del self.entries[key]
+            return None
+        return result_set
+
+    def put(self, key, result_set):
+        now = time.monotonic()
+        self.entries.pop(key, None)
+        self.entries[key] = (now + self.ttl, result_set)
+        while self.entries:
+            oldest_key, (expires, _) = next(iter(self.entries.items()))
+            if expires >= now and len(self.entries) <= self.max_entries:
+                break
+            del self.entries[oldest_key]
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,143 @@
+"""Admission control for command handlers, aware of Discord's 3 second acknowledgement deadline.
+
+At most `slots` handlers run at once. Further interactions wait in a queue ordered by their
+command's predicted cost, taken from its recent run times, so cheap lookups overtake heavy
+renders; once the queue is full new interactions are turned away with a busy message. An
+interaction that cannot be answered before its deadline, judging by its predicted cost and
+queue wait, is deferred up front, and one still queued close to its deadline is deferred
+then. Interactions Discord reports as unknown were not acknowledged in time and are counted
+as missed acknowledgements.
+"""
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from collections import Counter, deque
+
+import discord
+
+ACK_DEADLINE = 3.0
+# Unknown interaction: Discord's error once the acknowledgement deadline has passed.
+UNKNOWN_INTERACTION = 10062
+
+
+def remaining(interaction):
+    """Seconds left to acknowledge the interaction, judged from its snowflake timestamp."""
+    age = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    return min(ACK_DEADLINE, max(0.0, ACK_DEADLINE - age))
+
+
+class Scheduler:
+    def __init__(self, slots=16, max_queue=100, margin=0.75, history=50, default_cost=0.05):
+        self.slots = slots
+        self.max_queue = max_queue
+        self.margin = margin
+        self.history = history
+        self.default_cost = default_cost
+        self.running = 0
+        self.queue = []
+        self.sequence = itertools.count()
+        self.costs = {}
+        self.counters = Counter()
+
+    def predict(self, name):
+        """The 90th percentile of the command's recent run times, in seconds."""
+        costs = sorted(self.costs.get(name, ()))
+        if not costs:
+            return self.default_cost
+        return costs[min(len(costs) - 1, int(len(costs) * 0.9))]
+
+    def record(self, name, seconds):
+        self.costs.setdefault(name, deque(maxlen=self.history)).append(seconds)
+
+    def expected_wait(self, cost):
+        """Seconds a new interaction of this cost is likely to wait for a slot."""
+        if self.running < self.slots:
+            return 0.0
+        ahead = sum(queued for queued, _, _ in self.queue if queued <= cost)
+        return ahead / self.slots
+
+    def schedule(self, name):
+        """Decorate a command callback so it is admitted, queued and deferred by this scheduler."""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(interaction, *args, **kwargs):
+                try:
+                    return await self.admit(name, func, interaction, *args, **kwargs)
+                except discord.NotFound as error:
+                    if error.code != UNKNOWN_INTERACTION:
+                        raise
+                    self.counters["missed acks"] += 1
+
+            return wrapper
+
+        return decorator
+
+    async def admit(self, name, func, interaction, *args, **kwargs):
+        cost = self.predict(name)
+        deadline = time.monotonic() + remaining(interaction)
+
+        if self.running >= self.slots and len(self.queue) >= self.max_queue:
+            self.counters["shed"] += 1
+            embed = discord.Embed(
+                title="Busy",
+                description="The bot is handling a lot of requests right now. Please try again in a moment.",
+                colour=0xbea56f
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        if self.expected_wait(cost) + cost > deadline - time.monotonic() - self.margin:
+            await self.defer(interaction, "deferred early")
+        if self.running >= self.slots:
+            await self.wait_for_slot(interaction, cost, deadline)
+        else:
+            self.running += 1
+
+        self.counters["admitted"] += 1
+        start = time.perf_counter()
+        try:
+            return await func(interaction, *args, **kwargs)
+        finally:
+            self.record(name, time.perf_counter() - start)
+            self.release()
+
+    async def wait_for_slot(self, interaction, cost, deadline):
+        slot = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.queue, (cost, next(self.sequence), slot))
+        self.counters["queued"] += 1
+        try:
+            if not interaction.response.is_done():
+                timeout = max(0.0, deadline - time.monotonic() - self.margin)
+                try:
+                    await asyncio.wait_for(asyncio.shield(slot), timeout)
+                except asyncio.TimeoutError:
+                    await self.defer(interaction, "deferred in queue")
+            await slot
+        except BaseException:
+            # A failed defer (such as a missed acknowledgement) or a cancellation must not strand the slot:
+            # pass it on if it was already granted, otherwise leave it for release() to skip.
+            if slot.done() and not slot.cancelled():
+                self.release()
+            else:
+                slot.cancel()
+            raise
+
+    def release(self):
+        """Hand the finished handler's slot to the cheapest queued interaction."""
+        while self.queue:
+            _, _, slot = heapq.heappop(self.queue)
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self.running -= 1
+
+    async def defer(self, interaction, reason):
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+            self.counters[reason] += 1
+
+    def stats(self):
+        counters = ", ".join(f"{name} {count}" for name, count in sorted(self.counters.items())) or "nothing yet"
+        return f"scheduler: {self.running}/{self.slots} running, {len(self.queue)} queued; {counters}"
@@ -0,0 +1,365 @@
+"""Declarative description of every category command and the render plans compiled from it.
+
+Each Category says which CSV table it reads, which column is searched, which image folder
+holds its pictures, and how its multi-result summary and single-result detail fields are
+laid out. Field templates are str.format templates over the row's columns plus the
+category's derived values, and are checked against the table columns once at startup.
+"""
+import os
+from string import Formatter
+
+
+def format_stats(entries):
+    lines = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            lines.extend(f"**{key}**: {value}" for key, value in entry.items())
+        else:
+            lines.append(str(entry))
+    return "\n".join(lines)
+
+
+def location_fields(row):
+    return [
+        (f"**Location**: {location}", f"**Drops**: {', '.join(drops)}", False)
+        for location, drops in row['Locations & Drops'].items()
+    ]
+
+
+class Field:
+    def __init__(self, name, value, inline=False):
+        self.name = name
+        self.value = value
+        self.inline = inline
+
+
+class RenderContext(dict):
+    """Derived values for one row, falling back to the row's own columns."""
+
+    def __init__(self, row, derived):
+        super().__init__((key, compute(row)) for key, compute in derived.items())
+        self.row = row
+
+    def __missing__(self, key):
+        return self.row[key]
+
+
+class Category:
+    def __init__(self, key, command, description, title, fields, summary, noun=None, query_label="",
+                 search_column="name", exact_match=True, image_folder=None, optional_image=False,
+                 dlc_labels=("(DLC)", "(Base Game)"), summary_name="{name}", derived=None, compare=()):
+        self.key = key
+        self.command = command
+        self.description = description
+        self.title = title
+        self.noun = noun or title.lower()
+        self.query_label = query_label
+        self.fields = fields
+        self.summary = summary
+        self.summary_name = summary_name
+        self.search_column = search_column
+        self.exact_match = exact_match
+        self.image_folder = image_folder or key
+        self.optional_image = optional_image
+        self.dlc_labels = dlc_labels
+        self.derived = {"dlc_label": self.dlc_label, **(derived or {})}
+        # Key stats shown on /compare cards; categories without any cannot be compared.
+        self.compare = compare
+
+    def dlc_label(self, row):
+        return self.dlc_labels[0] if row['dlc'] == 1 else self.dlc_labels[1]
+
+    def compile(self, columns):
+        """Check every template against the table's columns so a typo fails at startup, not per request."""
+        known = set(columns) | set(self.derived)
+        templates = [self.summary, self.summary_name]
+        templates += [
+            part for field in [*self.fields, *self.compare] if isinstance(field, Field) for part in (field.name, field.value)
+        ]
+        for template in templates:
+            for _, key, _, _ in Formatter().parse(template):
+                if key is not None and key not in known:
+                    raise ValueError(f"{self.key}: template {template!r} uses unknown column {key!r}")
+
+    def summary_field(self, row):
+        return self.summary_name.format_map(row), self.summary.format_map(row), False
+
+    def detail_fields(self, row):
+        context = RenderContext(row, self.derived)
+        fields = []
+        for field in self.fields:
+            if isinstance(field, Field):
+                fields.append((field.name.format_map(context), field.value.format_map(context), field.inline))
+            else:
+                fields += field(row)
+        return fields
+
+    def compare_fields(self, row):
+        """(label, plain text) of the row's key stats, for drawing on a comparison card."""
+        context = RenderContext(row, self.derived)
+        return [(field.name, field.value.format_map(context).replace("**", "")) for field in self.compare]
+
+    def image(self, row):
+        """Local path of the row's image, or None when it has none."""
+        image_url = row['image']
+        if image_url is None or image_url == "No Image":
+            return None
+        return f'images/{self.image_folder}/{os.path.basename(image_url)}'
+
+
+NAME_FIELD = "**Name**: {name} {dlc_label}\n"
+ARMAMENT_STATS = (
+    Field("Weight", "{weight}"),
+    Field("Damage Type", "{damage type}"),
+    Field("Category", "{category}"),
+    Field("Skill", "{skill}"),
+    Field("Requirements", "{requirements_text}"),
+)
+SPELL_STATS = (
+    Field("FP", "{FP}"),
+    Field("Slot", "{slot}"),
+    Field("Requirements", "INT {INT} | FAI {FAI} | ARC {ARC}"),
+    Field("Stamina Cost", "{stamina cost}"),
+    Field("Effect", "{effect}"),
+)
+TITLE_FIELD = "{name} {dlc_label}"
+DESCRIPTION = Field("**Description**", "{description}")
+
+categories = [
+    Category(
+        "ashesOfWar", "ashe", "Search for an Ashe Of War", "Items",
+        dlc_labels=("(DLC)", ""),
+        summary="Affinity: {affinity} | Skill: {skill}",
+        fields=[
+            Field(TITLE_FIELD, "**Affinity**: {affinity}\n**Skill**: {skill}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "armors", "armor", "Search for an armor", "Items",
+        dlc_labels=("(DLC)", ""),
+        summary="Type: {type} | Weight: {weight}",
+        derived={
+            "special_effect": lambda row: row['special effect'] if row['special effect'] else 'None',
+            "damage_negation": lambda row: format_stats(row['damage negation']) or "N/A",
+            "resistance_text": lambda row: format_stats(row['resistance']) or "N/A",
+        },
+        fields=[
+            Field(NAME_FIELD, "**Type**: {type}\n**Weight**: {weight}\n**Special Effect**: {special_effect}"),
+            Field("**Damage Negation**", "{damage_negation}", True),
+            Field("**Resistance**", "{resistance_text}", True),
+            Field("​", "**How to Acquire**: {how to acquire}\n**In-Game Section**: {in-game section}"),
+            DESCRIPTION,
+        ],
+        compare=(
+            Field("Type", "{type}"),
+            Field("Weight", "{weight}"),
+            Field("Damage Negation", "{damage_negation}"),
+            Field("Resistance", "{resistance_text}"),
+        ),
+    ),
+    Category(
+        "bosses", "boss", "Search for a boss", "Bosses",
+        dlc_labels=("(DLC)", ""),
+        summary="HP: {HP} | Location(s): {Locations & Drops}",
+        derived={
+            "quote": lambda row: row['blockquote'] if row['blockquote'] is not None else "No quotes available.",
+        },
+        fields=[
+            Field(NAME_FIELD, "**HP**: {HP}"),
+            location_fields,
+            Field("**Quote**", "{quote}"),
+        ],
+    ),
+    Category(
+        "incantations", "incantation", "Search for an incantation", "Incantations",
+        summary="Effect: {effect} | FP: {FP}",
+        fields=[
+            Field(NAME_FIELD, (
+                "**Effect**: {effect}\n**FP**: {FP}\n**Slot**: {slot}\n**INT**: {INT}\n**FAI**: {FAI}\n"
+                "**ARC**: {ARC}\n**Stamina Cost**: {stamina cost}\n**Bonus**: {bonus}\n**Group**: {group}\n"
+                "**Location**: {location}"
+            )),
+            DESCRIPTION,
+        ],
+        compare=SPELL_STATS,
+    ),
+    Category(
+        "shields", "shield", "Search for a shield", "Shields",
+        summary="Weight: {weight} | Damage Type: {damage type}",
+        derived={"requirements_text": lambda row: format_stats(row['requirements']) or "No specific requirements."},
+        fields=[
+            Field(NAME_FIELD, (
+                "**Weight**: {weight}\n**Damage Type**: {damage type}\n**Category**: {category}\n"
+                "**Passive Effect**: {passive effect}\n**Skill**: {skill}\n**FP Cost**: {FP cost}\n"
+            )),
+            Field("**Requirements**", "{requirements_text}", True),
+            DESCRIPTION,
+        ],
+        compare=ARMAMENT_STATS,
+    ),
+    Category(
+        "skills", "skill", "Search for a skill", "Skills",
+        optional_image=True,
+        summary="Type: {type} | Equipment: {equipament}",
+        fields=[
+            Field(NAME_FIELD, (
+                "**Type**: {type}\n**Equipment**: {equipament}\n**Charge**: {charge}\n**FP**: {FP}\n"
+                "**Effect**: {effect}\n**Locations**: {locations}\n"
+            )),
+        ],
+    ),
+    Category(
+        "sorceries", "sorcery", "Search for sorcery", "Sorceries",
+        optional_image=True,
+        summary="Effect: {effect} | FP Cost: {FP}",
+        fields=[
+            Field(NAME_FIELD, (
+                "**Effect**: {effect}\n**FP**: {FP}\n**Slot**: {slot}\n"
+                "**INT**: {INT} | **FAI**: {FAI} | **ARC**: {ARC}\n**Stamina Cost**: {stamina cost}\n"
+                "**Bonus**: {bonus}\n**Location**: {location}\n"
+            )),
+            DESCRIPTION,
+        ],
+        compare=SPELL_STATS,
+    ),
+    Category(
+        "spiritAshes", "spirit", "Search for spirit", "Spirit Ashes", noun="Spirit Ashes",
+        summary="FP Cost: {FP cost} | HP Cost: {HP cost}",
+        fields=[
+            Field(NAME_FIELD, "**Type**: {type}\n**FP Cost**: {FP cost}\n**HP Cost**: {HP cost}\n**Effect**: {effect}\n"),
+            DESCRIPTION,
+        ],
+    ),
+    Category(
+        "talismans", "talisman", "Search for a talisman", "Talismans",
+        summary="Effect: {effect} | Weight: {weight} | Value: {value}",
+        fields=[
+            Field(NAME_FIELD, "**Effect**: {effect}\n**Weight**: {weight}\n**Value**: {value}\n"),
+            DESCRIPTION,
+        ],
+        compare=(Field("Effect", "{effect}"), Field("Weight", "{weight}")),
+    ),
+    Category(
+        "weapons", "weapon", "Search for a Weapon", "Weapons",
+        summary="Weight: {weight} | Damage Type: {damage type}",
+        derived={"requirements_text": lambda row: format_stats(row['requirements']) or "No specific requirements."},
+        fields=[
+            Field(NAME_FIELD, (
+                "**Weight**: {weight}\n**Damage Type**: {damage type}\n**Category**: {category}\n"
+                "**Passive Effect**: {passive effect}\n**Skill**: {skill}\n**FP Cost**: {FP cost}\n"
+            )),
+            Field("**Requirements**", "{requirements_text}", True),
+            DESCRIPTION,
+        ],
+        compare=ARMAMENT_STATS,
+    ),
+    Category(
+        "remembrances", "remembrance", "Search for a remembrance by boss name", "Remembrances",
+        query_label="boss ", search_column="boss", exact_match=False,
+        summary_name="{boss}",
+        summary="Type: {type} | Value: {value}",
+        fields=[
+            Field(TITLE_FIELD, (
+                "**Type**: {type}\n**Boss**: {boss}\n**Value**: {value}\n**Option 1**: {option 1}\n"
+                "**Option 2**: {option 2}\n\n**Description**: {description}"
+            ), True),
+        ],
+    ),
+    Category(
+        "consumables", "consumable", "Search for consumables", "Consumables",
+        summary="Effect: {effect} | FP Cost: {FP cost}",
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n**FP Cost**: {FP cost}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "crystalTears", "tear", "Search for a Crystal Tear", "Crystal Tears",
+        dlc_labels=("(DLC)", ""),
+        summary="Effect: {effect} | FP Cost: {FP cost}",
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n**FP Cost**: {FP cost}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "greatRunes", "greatrune", "Search for a Great Rune by boss name", "Great Runes",
+        search_column="boss",
+        dlc_labels=("(DLC)", ""),
+        summary="Type: {type} | Effect: {effect}",
+        fields=[
+            Field(TITLE_FIELD, (
+                "**Type**: {type}\n**Effect**: {effect}\n**Location**: {location}\n"
+                "**Divine Tower Location**: {divine tower locations}\n\n**Description**: {description}"
+            ), True),
+        ],
+    ),
+    Category(
+        "cookbooks", "cookbook", "Search for a Cookbook", "Cookbooks",
+        dlc_labels=("(DLC)", ""),
+        summary="Effect: {effect} | Required For: {required for}",
+        derived={"required_for": lambda row: ', '.join(row['required for'])},
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n**Required For**: {required_for}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "keyitems", "keyitem", "Search for a key item by name", "Key Items",
+        image_folder="keyItems",
+        dlc_labels=("(DLC)", ""),
+        summary="Type: {type} | Usage: {usage}",
+        fields=[
+            Field(TITLE_FIELD, (
+                "**Type**: {type}\n**Usage**: {usage}\n**Location**: {location}\n\n**Description**: {description}"
+            ), True),
+        ],
+    ),
+    Category(
+        "materials", "material", "Search for a material by name", "Materials",
+        dlc_labels=("(DLC)", ""),
+        summary="Effect: {effect}",
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "multi", "multi", "Search for a multiplayer item by name", "Items", noun="multiplayer items",
+        dlc_labels=("(DLC)", ""),
+        summary="Type: {type} | Effect: {effect}",
+        fields=[
+            Field(TITLE_FIELD, "**Type**: {type}\n**Effect**: {effect}\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "tools", "tool", "Search for a tool by name", "Tools",
+        dlc_labels=("(DLC)", ""),
+        summary="Type: {type} | Usage: {usage}",
+        fields=[
+            Field(TITLE_FIELD, (
+                "**Type**: {type}\n**Usage**: {usage}\n**Location**: {location}\n\n**Description**: {description}"
+            ), True),
+        ],
+    ),
+    Category(
+        "upgradeMaterials", "upgradematerial", "Search for an upgrade material by name", "Upgrade Materials",
+        dlc_labels=("(DLC)", ""),
+        summary="Effect: {effect}",
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "whetblades", "whetblade", "Search for a whetblade by name", "Whetblades",
+        dlc_labels=("(DLC)", ""),
+        summary="Usage: {usage} | Location: {location}",
+        fields=[
+            Field(TITLE_FIELD, "**Usage**: {usage}\n**Location**: {location}\n\n**Description**: {description}", True),
+        ],
+    ),
+    Category(
+        "bells", "bell", "Search for a bell bearing by name", "Bell Bearings",
+        dlc_labels=("(DLC)", ""),
+        summary="Effect: {effect} | Type: {type}",
+        fields=[
+            Field(TITLE_FIELD, "**Effect**: {effect}\n**Description**: {description}", True),
+        ],
+    ),
+]
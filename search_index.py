@@ -0,0 +1,281 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, namedtuple
+from heapq import heappop, heappush
+
+_APOSTROPHES = re.compile(r"['’‘`´]")
+_SEPARATORS = re.compile(r"[\s\-‐‑–—_/\\\[\]\(\)\{\}:;,.!?\"“”]+")
+
+# Bounds on spelling correction: longer queries are not corrected, and at most this many
+# corrected phrasings are looked up, so the work per query stays flat however many words miss.
+MAX_CORRECTED_WORDS = 8
+MAX_CORRECTED_COMBINATIONS = 64
+
+
+def normalize_name(value):
+    """Canonical search key: case-folded, apostrophes dropped, hyphens/brackets/whitespace collapsed."""
+    value = unicodedata.normalize("NFKC", value).casefold()
+    value = _APOSTROPHES.sub("", value)
+    return _SEPARATORS.sub(" ", value).strip()
+
+
+def word_starts(key):
+    return [0] + [i + 1 for i, char in enumerate(key) if char == " "]
+
+
+def trigrams(key):
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+def cheapest_combinations(words, limit):
+    """One correction per word, lowest summed edit distance first, at most limit combinations.
+
+    words holds each word's (distance, correction) pairs, closest first. Combinations are
+    expanded lazily from the cheapest, so only the ones consumed are ever built.
+    """
+    start = (0,) * len(words)
+    heap = [(sum(corrections[0][0] for corrections in words), start)]
+    seen = {start}
+    while heap and limit > 0:
+        total, choice = heappop(heap)
+        yield [corrections[index] for corrections, index in zip(words, choice)]
+        limit -= 1
+        for word, index in enumerate(choice):
+            corrections = words[word]
+            if index + 1 < len(corrections):
+                following = choice[:word] + (index + 1,) + choice[word + 1:]
+                if following not in seen:
+                    seen.add(following)
+                    heappush(heap, (total - corrections[index][0] + corrections[index + 1][0], following))
+
+
+def deletes(word, distance):
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(source, target, limit):
+    """Optimal string alignment distance, or limit + 1 once it is known to exceed limit."""
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SpellingIndex:
+    """SymSpell-style deletion dictionary over the words that appear in indexed names."""
+
+    def __init__(self, words, max_distance=2):
+        self.max_distance = max_distance
+        self.frequencies = Counter(words)
+        self.variants = {}
+        for word in self.frequencies:
+            for variant in deletes(word, max_distance):
+                self.variants.setdefault(variant, []).append(word)
+
+    def corrections(self, word):
+        if word in self.frequencies:
+            return [(0, word)]
+
+        limit = 0 if len(word) <= 2 else 1 if len(word) <= 4 else self.max_distance
+        candidates = set()
+        for variant in deletes(word, limit):
+            candidates.update(self.variants.get(variant, ()))
+
+        scored = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                scored.append((distance, -self.frequencies[candidate], candidate))
+        scored.sort()
+        return [(distance, candidate) for distance, _, candidate in scored]
+
+
+class NameIndex:
+    """Normalized-name index over one column of a category table, built once at load time."""
+
+    def __init__(self, table, column="name"):
+        self.table = table
+        self.column = column
+        self.build(table.column(column))
+
+    def build(self, names):
+        self.names = names
+        self.keys = [normalize_name(value) if isinstance(value, str) else "" for value in self.names]
+        self.exact = {}
+        self.postings = {}
+        for position, key in enumerate(self.keys):
+            if key:
+                self.exact.setdefault(key, []).append(position)
+            for gram in trigrams(key):
+                self.postings.setdefault(gram, []).append(position)
+        self.spelling = SpellingIndex(word for key in self.keys for word in key.split())
+        self.completions = sorted(
+            (key[start:], position) for position, key in enumerate(self.keys) for start in word_starts(key)
+        )
+        self.completion_keys = [suffix for suffix, _ in self.completions]
+        self.default_completions = sorted({name for name in self.names if isinstance(name, str)}, key=normalize_name)
+
+    def substring(self, key):
+        if len(key) < 3:
+            return [position for position, name in enumerate(self.keys) if key in name]
+
+        postings = []
+        for gram in trigrams(key):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        return [position for position in sorted(candidates) if key in self.keys[position]]
+
+    def lookup(self, search_value, exact=True):
+        key = normalize_name(search_value)
+        if not key:
+            return []
+
+        if exact:
+            positions = self.exact.get(key)
+            if positions:
+                return positions
+
+        return self.substring(key)
+
+    def search(self, search_value, exact=True):
+        return [self.table[position] for position in self.lookup(search_value, exact)]
+
+    def corrected_positions(self, search_value, corrections_per_word=3):
+        """Positions matching spelling-corrected forms of search_value, closest corrections first.
+
+        Queries of more than MAX_CORRECTED_WORDS words are not corrected, and only the
+        MAX_CORRECTED_COMBINATIONS closest phrasings are looked up.
+        """
+        query_words = normalize_name(search_value).split()
+        if len(query_words) > MAX_CORRECTED_WORDS:
+            return
+        words = []
+        for word in query_words:
+            corrections = self.spelling.corrections(word)[:corrections_per_word]
+            if not corrections:
+                return
+            words.append(corrections)
+        if not words:
+            return
+
+        for combination in cheapest_combinations(words, MAX_CORRECTED_COMBINATIONS):
+            key = " ".join(word for _, word in combination)
+            positions = self.exact.get(key) or self.substring(key)
+            yield from sorted(positions, key=lambda position: len(self.keys[position]))
+
+    def suggest(self, search_value, limit=5):
+        suggestions = []
+        for position in self.corrected_positions(search_value):
+            name = self.names[position]
+            if name not in suggestions:
+                suggestions.append(name)
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
+
+    def complete(self, prefix, limit=25, max_scan=500):
+        """Names whose full key or any word in it starts with prefix, whole-name matches first.
+
+        At most max_scan index entries are visited, which bounds the work done per keystroke.
+        """
+        key = normalize_name(prefix)
+        if not key:
+            return self.default_completions[:limit]
+
+        leading = []
+        inner = []
+        seen = set()
+        start = bisect_left(self.completion_keys, key)
+        for suffix, position in self.completions[start:start + max_scan]:
+            if not suffix.startswith(key):
+                break
+            name = self.names[position]
+            if name in seen:
+                continue
+            seen.add(name)
+            if suffix == self.keys[position]:
+                leading.append(name)
+                if len(leading) >= limit:
+                    break
+            else:
+                inner.append(name)
+
+        return (leading + inner)[:limit]
+
+
+SearchHit = namedtuple("SearchHit", "category position name quality")
+
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING, CORRECTED, FULL_TEXT = range(6)
+
+
+class GlobalIndex(NameIndex):
+    """Every category's names merged into one index whose positions resolve to (category, row position)."""
+
+    def __init__(self, indexes):
+        self.table = None
+        self.column = None
+        self.refs = [(category, position) for category, index in indexes.items() for position in range(len(index.names))]
+        self.build([name for index in indexes.values() for name in index.names])
+
+    def hit(self, position, quality):
+        category, row_position = self.refs[position]
+        return SearchHit(category, row_position, self.names[position], quality)
+
+    def quality(self, key, position):
+        name = self.keys[position]
+        if name == key:
+            return EXACT
+        if name.startswith(key):
+            return PREFIX
+        if f" {key}" in name:
+            return WORD_PREFIX
+        return SUBSTRING
+
+    def search(self, search_value, limit=None):
+        """SearchHits across all categories from one lookup, best match quality first."""
+        key = normalize_name(search_value)
+        if not key:
+            return []
+
+        hits = [self.hit(position, self.quality(key, position)) for position in self.substring(key)]
+        if hits:
+            hits.sort(key=lambda hit: (hit.quality, len(hit.name), hit.name))
+            return hits[:limit]
+
+        seen = set()
+        for position in self.corrected_positions(search_value):
+            if position not in seen:
+                seen.add(position)
+                hits.append(self.hit(position, CORRECTED))
+                if limit and len(hits) >= limit:
+                    break
+        return hits
@@ -0,0 +1,35 @@
+"""Identical lookups in flight at the same time share one computation.
+
+Keys are (command, normalized query, render profile). The first caller starts the
+computation and later callers with the same key await the same task until it finishes,
+so a burst of the same query is searched, rendered and built once. A caller that goes
+away does not cancel the computation for the others.
+"""
+import asyncio
+from collections import Counter
+
+
+class SingleFlight:
+    def __init__(self):
+        self.flights = {}
+        self.computed = Counter()
+        self.collapsed = Counter()
+
+    async def run(self, key, compute):
+        """The result of compute(), shared with every concurrent call for the same key."""
+        task = self.flights.get(key)
+        if task is None:
+            self.computed[key[0]] += 1
+            task = asyncio.ensure_future(compute())
+            self.flights[key] = task
+            task.add_done_callback(lambda _: self.flights.pop(key, None))
+        else:
+            self.collapsed[key[0]] += 1
+        return await asyncio.shield(task)
+
+    def stats(self):
+        computed, collapsed = sum(self.computed.values()), sum(self.collapsed.values())
+        share = collapsed / (computed + collapsed) if computed + collapsed else 0.0
+        busiest = ", ".join(f"/{command} {count}" for command, count in self.collapsed.most_common(3))
+        return (f"single flight: {computed} lookups computed, {collapsed} duplicates collapsed ({share:.0%})"
+                + (f", most by {busiest}" if busiest else ""))
@@ -0,0 +1,134 @@
+"""Compiled data snapshot: parsed tables, name indexes, the image manifest and the rendered responses in one file.
+
+Build it after changing anything under eldenringScrap/ or images/, or the code that builds it:
+
+    python snapshot.py
+
+The bot memory-maps the snapshot at startup and falls back to the CSVs when it is
+missing, from another SNAPSHOT_VERSION, or was built from different CSVs, image files or
+build sources.
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import time
+
+from data import csv_files
+from image_manifest import ImageManifest, image_folders
+from records import load_tables
+from response_bundle import ResponseBundle
+from schemas import categories
+from search_index import GlobalIndex, NameIndex
+
+SNAPSHOT_PATH = 'eldenring.snapshot'
+SNAPSHOT_MAGIC = b'ERSNAP'
+# Bump whenever the pickled structures in build_state() change shape.
+SNAPSHOT_VERSION = 4
+# Every module build_state() runs, so a change to parsing, indexing, the manifest or the templates rebuilds it.
+BUILD_SOURCES = (
+    'data.py', 'records.py', 'search_index.py', 'image_manifest.py', 'schemas.py', 'response_bundle.py', 'snapshot.py',
+)
+
+_HEADER = struct.Struct('<6sH32s')
+
+
+def source_hash(files=csv_files):
+    digest = hashlib.sha256()
+    for category, path in sorted(files.items()):
+        digest.update(category.encode())
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.digest()
+
+
+def image_listing(root='images'):
+    listing = {}
+    for folder in image_folders(root):
+        with os.scandir(os.path.join(root, folder)) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    listing[f"{root}/{folder}/{entry.name}"] = (stat.st_size, stat.st_mtime_ns)
+    return listing
+
+
+def snapshot_digest():
+    """The CSV contents, each image's size and mtime and the build sources, so any of them rebuilds the snapshot."""
+    digest = hashlib.sha256(source_hash())
+    for path in BUILD_SOURCES:
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    for path, (size, mtime_ns) in sorted(image_listing().items()):
+        digest.update(f"{path}\0{size}\0{mtime_ns}\n".encode())
+    return digest.digest()
+
+
+def build_state():
+    tables = load_tables()
+    name_indexes = {name: NameIndex(table) for name, table in tables.items()}
+    image_manifest = ImageManifest(tables, categories)
+    return {
+        "tables": tables,
+        "name_indexes": name_indexes,
+        "boss_indexes": {
+            category.key: NameIndex(tables[category.key], column=category.search_column)
+            for category in categories if category.search_column != "name"
+        },
+        "global_index": GlobalIndex(name_indexes),
+        "image_manifest": image_manifest,
+        "response_bundle": ResponseBundle(tables, categories, image_manifest),
+    }
+
+
+def write_snapshot(state, digest, path=SNAPSHOT_PATH):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'wb') as file:
+        file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, digest))
+        pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+
+def read_snapshot(digest, path=SNAPSHOT_PATH):
+    """The snapshot's state, or None when it is missing, from another version or built from other CSVs."""
+    try:
+        file = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+
+    with file:
+        if os.fstat(file.fileno()).st_size < _HEADER.size:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _HEADER.unpack_from(mapped) != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, digest):
+                return None
+            with memoryview(mapped)[_HEADER.size:] as payload:
+                return pickle.loads(payload)
+
+
+def load_state(path=SNAPSHOT_PATH):
+    start = time.perf_counter()
+    digest = snapshot_digest()
+    state = read_snapshot(digest, path)
+    if state is not None:
+        print(f"Loaded data snapshot {path} in {(time.perf_counter() - start) * 1e3:.0f} ms")
+    else:
+        print(f"Data snapshot {path} is missing or stale, loading the CSV files")
+        state = build_state()
+        try:
+            write_snapshot(state, digest, path)
+        except OSError as e:
+            print(f"Could not write data snapshot {path}: {e}")
+        print(f"Loaded the CSV files in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    # Identifies the data the state was built from, for caches of anything derived from it.
+    state["version"] = digest.hex()
+    return state
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    write_snapshot(build_state(), snapshot_digest())
+    print(f"Wrote {SNAPSHOT_PATH} ({os.path.getsize(SNAPSHOT_PATH) / 1024:.0f} KiB) "
+          f"in {(time.perf_counter() - start) * 1e3:.0f} ms")
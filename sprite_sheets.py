@@ -0,0 +1,66 @@
+"""Numbered sprite sheets of thumbnails, sent with multi-result responses.
+
+A sheet's key hashes the layout version and the content digests of its images in order,
+so the same result set maps to the same sheet, which is drawn and uploaded once.
+"""
+import hashlib
+import json
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from compare_cards import save_png
+
+SHEETS_PATH = 'sheets'
+# Bump whenever the sheet layout changes, so cached sheets are redrawn.
+SHEET_VERSION = 1
+
+COLUMNS = 5
+TILE_SIZE = (128, 128)
+GAP = 8
+BADGE_RADIUS = 14
+BACKGROUND = (30, 27, 22)
+TILE_BACKGROUND = (44, 40, 33)
+GOLD = (190, 165, 111)
+
+
+def sheet_key(digests):
+    """Key of the sheet for images with these content digests (None for a row without one), in order."""
+    return hashlib.sha256(json.dumps([SHEET_VERSION, digests]).encode()).hexdigest()
+
+
+def sheet_path(key):
+    return os.path.join(SHEETS_PATH, f"{key}.png")
+
+
+def render_sheet(paths, path):
+    """Draw one numbered tile per image path (None leaves the tile empty) and write the PNG to path."""
+    font = ImageFont.load_default(size=16)
+    rows = (len(paths) + COLUMNS - 1) // COLUMNS
+    columns = min(len(paths), COLUMNS)
+    width = GAP + columns * (TILE_SIZE[0] + GAP)
+    height = GAP + rows * (TILE_SIZE[1] + GAP)
+    sheet = Image.new("RGB", (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+
+    for index, image_path in enumerate(paths):
+        left = GAP + index % COLUMNS * (TILE_SIZE[0] + GAP)
+        top = GAP + index // COLUMNS * (TILE_SIZE[1] + GAP)
+        draw.rectangle([left, top, left + TILE_SIZE[0] - 1, top + TILE_SIZE[1] - 1], fill=TILE_BACKGROUND)
+        if image_path is not None:
+            with Image.open(image_path) as image:
+                image.seek(0)
+                picture = image.convert("RGBA")
+            picture.thumbnail(TILE_SIZE)
+            offset = (left + (TILE_SIZE[0] - picture.width) // 2, top + (TILE_SIZE[1] - picture.height) // 2)
+            sheet.paste(picture, offset, picture)
+
+        # Numbers match the order of the fields in the embed.
+        centre = (left + BADGE_RADIUS + 4, top + BADGE_RADIUS + 4)
+        draw.ellipse(
+            [centre[0] - BADGE_RADIUS, centre[1] - BADGE_RADIUS, centre[0] + BADGE_RADIUS, centre[1] + BADGE_RADIUS],
+            fill=GOLD
+        )
+        draw.text(centre, str(index + 1), font=font, fill=BACKGROUND, anchor="mm")
+
+    save_png(sheet, path)
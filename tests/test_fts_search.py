@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import fts_search
+from fts_search import FullTextIndex
+from snapshot import load_state, source_hash
+
+
+class FullTextIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tables = load_state()["tables"]
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "fts.sqlite")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def open(self):
+        return FullTextIndex(self.tables, source_hash(), self.path)
+
+    def test_rebuilds_only_when_its_build_sources_change(self):
+        self.open()
+        with mock.patch.object(FullTextIndex, "rebuild") as rebuild:
+            self.open()
+            rebuild.assert_not_called()
+            with mock.patch.object(fts_search, "BUILD_SOURCES", fts_search.BUILD_SOURCES + ("search_index.py",)):
+                self.open()
+            rebuild.assert_called_once()
+
+    def test_category_rows_are_not_capped(self):
+        index = self.open()
+        rows = index.search_rows("fire", "skills")
+        self.assertGreater(len(rows), 25)
+        self.assertEqual(len(index.search("fire", "skills", limit=5)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import types
+import unittest
+
+import discord
+
+from scheduler import UNKNOWN_INTERACTION, Scheduler
+
+
+def unknown_interaction():
+    return discord.NotFound(types.SimpleNamespace(status=404, reason="Not Found"),
+                            {"code": UNKNOWN_INTERACTION, "message": "Unknown interaction"})
+
+
+class FakeResponse:
+    def __init__(self, fail_defer=False):
+        self.fail_defer = fail_defer
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def defer(self, **kwargs):
+        if self.fail_defer:
+            raise unknown_interaction()
+        self.done = True
+
+    async def send_message(self, **kwargs):
+        self.done = True
+
+
+class FakeInteraction:
+    def __init__(self, number, fail_defer=False):
+        self.id = number
+        self.created_at = discord.utils.utcnow()
+        self.response = FakeResponse(fail_defer)
+
+
+class WaitForSlotTest(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_defer_in_queue_releases_the_slot(self):
+        # A margin this wide makes a queued interaction defer after 0.1 s instead of 2.25 s.
+        scheduler = Scheduler(slots=1, margin=2.9)
+        ran = []
+
+        async def handler(interaction, seconds):
+            await asyncio.sleep(seconds)
+            ran.append(interaction.id)
+
+        command = scheduler.schedule("command")(handler)
+        holder = asyncio.create_task(command(FakeInteraction(1), 0.3))
+        await asyncio.sleep(0)
+        # Queued behind the holder; its defer fails as a missed acknowledgement would.
+        await command(FakeInteraction(2, fail_defer=True), 0)
+        await holder
+
+        self.assertEqual(scheduler.counters["missed acks"], 1)
+        self.assertEqual(scheduler.running, 0)
+        await asyncio.wait_for(command(FakeInteraction(3), 0), 1)
+        self.assertEqual(ran, [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
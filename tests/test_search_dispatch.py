@@ -0,0 +1,68 @@
+import itertools
+import os
+import unittest
+
+os.environ.setdefault("DISCORD_STATUS", "online")
+
+import main  # noqa: E402
+from schemas import categories  # noqa: E402
+from search_index import normalize_name  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self):
+        self.sent = None
+
+    def is_done(self):
+        return self.sent is not None
+
+    async def send_message(self, **kwargs):
+        self.sent = kwargs
+
+
+class FakeInteraction:
+    ids = itertools.count(1)
+
+    def __init__(self):
+        self.id = next(self.ids)
+        self.response = FakeResponse()
+
+
+class SearchDispatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_every_name_dispatches(self):
+        for category in categories:
+            for name in main.tables[category.key].column("name"):
+                if not isinstance(name, str) or len(name) < 3:
+                    continue
+                with self.subTest(category=category.key, name=name):
+                    payload = await main.prepare_search_results(normalize_name(name), "text")
+                    self.assertTrue(payload.embed)
+
+    async def test_single_hit_opens_its_row(self):
+        # Great runes are searched by boss, and this one has none.
+        table = main.tables["greatRunes"]
+        row = next(row for row in table if row["name"] == "Phantom Great Rune")
+        payload = await main.prepare_search_results(normalize_name("Phantom Great Rune"), "text")
+        self.assertEqual(payload.embed["fields"], main.response_bundle.get(row).embed["fields"])
+
+
+class SpellingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_shared_response_quotes_each_users_spelling(self):
+        prepared = []
+
+        async def prepare():
+            prepared.append(True)
+            return await main.prepare_search_results(normalize_name("Alberich's"), "text")
+
+        for spelling in ("Alberich's", "ALBERICHS"):
+            interaction = FakeInteraction()
+            key = ("search", normalize_name(spelling), "text")
+            await main.answer(interaction, key, prepare, (spelling,))
+            self.assertIn(f"'**{spelling}**'", interaction.response.sent["embed"].description)
+            # Page turns rebuild the embed from the stored set.
+            self.assertIn(f"'**{spelling}**'", main.result_pages.get(interaction.id).embed["description"])
+        self.assertEqual(len(prepared), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
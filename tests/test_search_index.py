@@ -0,0 +1,57 @@
+import itertools
+import unittest
+from unittest import mock
+
+import search_index
+from search_index import NameIndex, cheapest_combinations
+
+
+class FakeTable(list):
+    def column(self, name):
+        return [row[name] for row in self]
+
+
+class CheapestCombinationsTest(unittest.TestCase):
+    def test_same_order_as_sorting_every_combination(self):
+        words = [
+            [(0, "a"), (1, "b"), (2, "c")],
+            [(1, "d"), (1, "e"), (2, "f")],
+            [(0, "g"), (2, "h")],
+        ]
+        expected = sorted(itertools.product(*words), key=lambda combination: sum(d for d, _ in combination))
+        self.assertEqual(list(cheapest_combinations(words, 100)), [list(combination) for combination in expected])
+
+    def test_stops_at_limit(self):
+        words = [[(0, "a"), (1, "b"), (2, "c")]] * 20
+        self.assertEqual(len(list(cheapest_combinations(words, 5))), 5)
+
+    def test_is_lazy(self):
+        # 3^40 combinations: only the ones consumed may be built.
+        words = [[(1, "a"), (1, "b"), (1, "c")]] * 40
+        first = next(cheapest_combinations(words, 10 ** 30))
+        self.assertEqual(first, [(1, "a")] * 40)
+
+
+class CorrectedPositionsTest(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex(FakeTable([{"name": "Sword of Night and Flame"}, {"name": "Night Sword"}]))
+
+    def test_corrects_misspelled_words(self):
+        self.assertEqual(self.index.suggest("swrod of nigth"), ["Sword of Night and Flame"])
+
+    def test_long_queries_are_not_corrected(self):
+        query = " ".join(["swrod"] * (search_index.MAX_CORRECTED_WORDS + 1))
+        self.assertEqual(list(self.index.corrected_positions(query)), [])
+
+    def test_looks_up_at_most_max_combinations(self):
+        # Each word has three corrections, so the query has 27 corrected phrasings.
+        index = NameIndex(FakeTable([{"name": "Band Bend"}, {"name": "Bind Bond"}]))
+        for limit in (27, 3):
+            with mock.patch.object(search_index, "MAX_CORRECTED_COMBINATIONS", limit), \
+                    mock.patch.object(NameIndex, "substring", return_value=[]) as substring:
+                list(index.corrected_positions("bxnd bxnd bxnd"))
+            self.assertEqual(substring.call_count, limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Blocking search and render stages run in worker pools, and a monitor measures event-loop lag.
+
+Searches run in a thread pool. Drawing cards and sheets is CPU-bound and can be sent to a
+process pool instead, so it does not hold the interpreter lock the event loop needs. The
+process pool forks, so it is only available on POSIX, and heavy work falls back to the
+thread pool elsewhere or when no processes are configured. Its processes are forked as soon
+as the pool is created, before the bot starts its own threads, since a process forked while
+another thread holds a lock inherits that lock held.
+"""
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+LAG_WARNING = 0.1
+
+
+class Workers:
+    def __init__(self, threads=None, processes=0):
+        self.threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="worker")
+        self.processes = None
+        if processes and "fork" in multiprocessing.get_all_start_methods():
+            self.processes = ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("fork"))
+            # A forking pool starts every process on its first submission; make that happen now.
+            self.processes.submit(int).result()
+
+    async def run(self, func, *args, heavy=False):
+        """func(*args) in the process pool when heavy and there is one, otherwise in the thread pool."""
+        executor = self.processes if heavy and self.processes is not None else self.threads
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+    def shutdown(self):
+        self.threads.shutdown(wait=False, cancel_futures=True)
+        if self.processes is not None:
+            self.processes.shutdown(wait=False, cancel_futures=True)
+
+
+class LoopMonitor:
+    """Wakes up every interval and records how late the event loop ran it."""
+
+    def __init__(self, interval=0.05, window=1200):
+        self.interval = interval
+        self.lags = deque(maxlen=window)
+        self.max_lag = 0.0
+        self.task = None
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            self.lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            if lag > LAG_WARNING:
+                print(f"Event loop lagged {lag * 1e3:.0f} ms")
+
+    def stats(self):
+        lags = sorted(self.lags)
+        if not lags:
+            return "event loop: no samples yet"
+        p50, p99 = (lags[min(len(lags) - 1, int(len(lags) * fraction))] for fraction in (0.5, 0.99))
+        return (f"event loop lag over the last {len(lags)} samples: p50 {p50 * 1e3:.1f} ms, "
+                f"p99 {p99 * 1e3:.1f} ms, max since start {self.max_lag * 1e3:.1f} ms")